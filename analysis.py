@@ -1,13 +1,44 @@
 import os
 import math
 import csv
+import heapq
+import importlib.util
+import operator
+import random
+from array import array
+from bisect import bisect_right
 from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
 
-from grafh_blibiotecas.adjacency_list_graph import AdjacencyListGraph
-from main import ensure_data_files, load_jsons, collect_users, build_integrated_graph
+from grafh_blibiotecas.abstract_graph import AbstractGraph
+from grafh_blibiotecas.csr_graph import CSRGraph
+from grafh_blibiotecas.graph_factory import toList
+from grafh_blibiotecas.graph_views import SubgraphView
+from grafh_blibiotecas.metric_cache import MetricCache
+from grafh_blibiotecas.strong_components import condensation, stronglyConnectedComponentIds
+from main import (
+    DATA_DIR,
+    EXPORT_FORMATS,
+    INTEGRATED_WEIGHTS,
+    SNAPSHOT_FILE,
+    ensure_data_files,
+    load_jsons,
+    collect_users,
+    collect_edge_arrays,
+    build_labeled_graph,
+)
 
+BETWEENNESS_CHUNK_SIZE = 32
+BETWEENNESS_MAX_CHUNKS = 64
+MSBFS_BATCH_SIZE = 64
+METRIC_CACHE_DIR = "metric_cache"
 
-def compute_degrees(graph: AdjacencyListGraph):
+METRIC_CACHE = MetricCache()
+
+
+@METRIC_CACHE.memoize()
+def compute_degrees(graph: AbstractGraph):
     numero_vertices = graph.getVertexCount()
     graus_entrada = {vertice: graph.getVertexInDegree(vertice) for vertice in range(numero_vertices)}
     graus_saida = {vertice: graph.getVertexOutDegree(vertice) for vertice in range(numero_vertices)}
@@ -15,12 +46,12 @@ def compute_degrees(graph: AdjacencyListGraph):
     return graus_entrada, graus_saida, graus_total
 
 
-def bfs_distances_directed(graph: AdjacencyListGraph, vertice_inicial: int):
+def bfs_distances_directed(graph: AbstractGraph, vertice_inicial: int):
     distancias = {vertice_inicial: 0}
     fila = deque([vertice_inicial])
     while fila:
         vertice_atual = fila.popleft()
-        for vizinho in graph._adjacency[vertice_atual].keys():
+        for vizinho in graph.getSuccessors(vertice_atual):
             if vizinho not in distancias:
                 distancias[vizinho] = distancias[vertice_atual] + 1
                 fila.append(vizinho)
@@ -28,10 +59,14 @@ def bfs_distances_directed(graph: AdjacencyListGraph, vertice_inicial: int):
     return distancias
 
 
-def closeness_centrality(graph: AdjacencyListGraph):
+@METRIC_CACHE.memoize(persistent=True, ignore=("batched",))
+def closeness_centrality(graph: AbstractGraph, batched=True):
     numero_vertices = graph.getVertexCount()
     centralidade = {}
-    
+
+    if batched:
+        return closeness_from_statistics(msbfs_statistics(graph))
+
     for vertice_atual in range(numero_vertices):
         distancias = bfs_distances_directed(graph, vertice_atual) 
         if len(distancias) <= 1:
@@ -43,134 +78,671 @@ def closeness_centrality(graph: AdjacencyListGraph):
     return centralidade
 
 
-def betweenness_centrality(graph: AdjacencyListGraph):
+def closeness_from_statistics(estatisticas):
+    alcancaveis, somas_distancias, _ = estatisticas
+    return {
+        vertice: alcancaveis[vertice] / somas_distancias[vertice] if alcancaveis[vertice] else 0.0
+        for vertice in range(len(alcancaveis))
+    }
+
+
+def harmonic_centrality(graph: AbstractGraph):
+    _, _, harmonicas = msbfs_statistics(graph)
+    return dict(enumerate(harmonicas))
+
+
+def reachability_counts(graph: AbstractGraph):
+    alcancaveis, _, _ = msbfs_statistics(graph)
+    return dict(enumerate(alcancaveis))
+
+
+def _add_to_bit_counters(planos, mascara):
+    transporte = mascara
+    for indice in range(len(planos)):
+        plano = planos[indice]
+        planos[indice] = plano ^ transporte
+        transporte &= plano
+        if not transporte:
+            return
+    planos.append(transporte)
+
+
+def msbfs_batch(offsets, targets, origens, visitados):
+    alcancaveis = [0] * len(origens)
+    somas_distancias = [0] * len(origens)
+    harmonicas = [0.0] * len(origens)
+
+    fronteira = {}
+    for bit, origem in enumerate(origens):
+        fronteira[origem] = fronteira.get(origem, 0) | (1 << bit)
+    for origem, mascara in fronteira.items():
+        visitados[origem] = mascara
+    tocados = list(fronteira)
+
+    nivel = 0
+    while fronteira:
+        nivel += 1
+        proxima = {}
+        for vertice_atual, mascara in fronteira.items():
+            for vizinho in targets[offsets[vertice_atual]:offsets[vertice_atual + 1]]:
+                novos = mascara & ~visitados[vizinho]
+                if novos:
+                    if not visitados[vizinho]:
+                        tocados.append(vizinho)
+                    visitados[vizinho] |= novos
+                    proxima[vizinho] = proxima.get(vizinho, 0) | novos
+
+        planos = []
+        for mascara in proxima.values():
+            _add_to_bit_counters(planos, mascara)
+        for bit in range(len(origens)):
+            quantidade = 0
+            for peso, plano in enumerate(planos):
+                quantidade |= ((plano >> bit) & 1) << peso
+            if quantidade:
+                alcancaveis[bit] += quantidade
+                somas_distancias[bit] += nivel * quantidade
+                harmonicas[bit] += quantidade / nivel
+        fronteira = proxima
+
+    for vertice_atual in tocados:
+        visitados[vertice_atual] = 0
+    return alcancaveis, somas_distancias, harmonicas
+
+
+@METRIC_CACHE.memoize(ignore=("batch_size",))
+def msbfs_statistics(graph: AbstractGraph, batch_size=MSBFS_BATCH_SIZE):
     numero_vertices = graph.getVertexCount()
-    centralidade = {i: 0.0 for i in range(numero_vertices)}
-    
-    for origem in range(numero_vertices):
-        pilha = []
-        predecessores = {i: [] for i in range(numero_vertices)}
-        
-        contagem_caminhos = {i: 0.0 for i in range(numero_vertices)}
-        contagem_caminhos[origem] = 1.0
-        
-        distancias = {i: -1 for i in range(numero_vertices)}
+    offsets, targets = csr_arrays(graph)
+    visitados = [0] * numero_vertices
+    alcancaveis = []
+    somas_distancias = []
+    harmonicas = []
+
+    for inicio in range(0, numero_vertices, batch_size):
+        origens = range(inicio, min(inicio + batch_size, numero_vertices))
+        lote = msbfs_batch(offsets, targets, origens, visitados)
+        alcancaveis.extend(lote[0])
+        somas_distancias.extend(lote[1])
+        harmonicas.extend(lote[2])
+
+    return alcancaveis, somas_distancias, harmonicas
+
+
+@METRIC_CACHE.memoize()
+def csr_arrays(graph: AbstractGraph):
+    if isinstance(graph, CSRGraph):
+        return graph._offsets, graph._targets
+    offsets = array("q", [0])
+    targets = array("q")
+    for vertice in range(graph.getVertexCount()):
+        targets.extend(graph.getSuccessors(vertice))
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def inverse_weight(peso):
+    return 1.0 / peso
+
+
+@METRIC_CACHE.memoize()
+def csr_weighted_arrays(graph: AbstractGraph, weight_to_distance=inverse_weight):
+    if isinstance(graph, CSRGraph):
+        offsets, targets = graph._offsets, graph._targets
+        pesos = graph._weights
+    else:
+        offsets = array("q", [0])
+        targets = array("q")
+        pesos = array("d")
+        for vertice in range(graph.getVertexCount()):
+            for vizinho, peso in graph.getWeightedSuccessors(vertice):
+                targets.append(vizinho)
+                pesos.append(peso)
+            offsets.append(len(targets))
+    custos = array("d", map(weight_to_distance, pesos))
+    for custo in custos:
+        if not custo > 0 or custo == math.inf:
+            raise ValueError("Distância de aresta deve ser positiva e finita")
+    return offsets, targets, custos
+
+
+def dijkstra_csr(offsets, targets, custos, vertice_inicial):
+    distancias = {vertice_inicial: 0.0}
+    resolvidos = set()
+    heap = [(0.0, vertice_inicial)]
+    while heap:
+        distancia_atual, vertice_atual = heapq.heappop(heap)
+        if vertice_atual in resolvidos:
+            continue
+        resolvidos.add(vertice_atual)
+        for indice in range(offsets[vertice_atual], offsets[vertice_atual + 1]):
+            vizinho = targets[indice]
+            nova_distancia = distancia_atual + custos[indice]
+            if nova_distancia < distancias.get(vizinho, math.inf):
+                distancias[vizinho] = nova_distancia
+                heapq.heappush(heap, (nova_distancia, vizinho))
+    return distancias
+
+
+def has_non_unit_weights(graph: AbstractGraph):
+    return any(peso != 1.0 for peso in graph.getEdgeArrays()[2])
+
+
+@METRIC_CACHE.memoize(persistent=True)
+def weighted_closeness_centrality(graph: AbstractGraph, weight_to_distance=inverse_weight):
+    numero_vertices = graph.getVertexCount()
+    offsets, targets, custos = csr_weighted_arrays(graph, weight_to_distance)
+    centralidade = {}
+
+    for vertice_atual in range(numero_vertices):
+        distancias = dijkstra_csr(offsets, targets, custos, vertice_atual)
+        soma_distancias = sum(distancias.values())
+        if len(distancias) <= 1 or soma_distancias == 0:
+            centralidade[vertice_atual] = 0.0
+            continue
+        centralidade[vertice_atual] = (len(distancias) - 1) / soma_distancias
+
+    return centralidade
+
+
+def brandes_partial(offsets, targets, origens, buffers, parcial):
+    distancias, contagem_caminhos, dependencia = buffers
+
+    for origem in origens:
         distancias[origem] = 0
-        
-        fila = deque([origem])
-        
-        while fila:
-            vertice_atual = fila.popleft()
-            pilha.append(vertice_atual)
-            
-            for vizinho in graph._adjacency[vertice_atual].keys():
+        contagem_caminhos[origem] = 1.0
+        ordem = [origem]
+        posicao = 0
+
+        while posicao < len(ordem):
+            vertice_atual = ordem[posicao]
+            posicao += 1
+            proxima_distancia = distancias[vertice_atual] + 1
+            caminhos_atual = contagem_caminhos[vertice_atual]
+            for vizinho in targets[offsets[vertice_atual]:offsets[vertice_atual + 1]]:
                 if distancias[vizinho] < 0:
-                    fila.append(vizinho)
-                    distancias[vizinho] = distancias[vertice_atual] + 1
-                
-                if distancias[vizinho] == distancias[vertice_atual] + 1:
-                    contagem_caminhos[vizinho] += contagem_caminhos[vertice_atual]
-                    predecessores[vizinho].append(vertice_atual)
-        
-        dependencia = {i: 0.0 for i in range(numero_vertices)}
-        
-        while pilha:
-            vertice_pilha = pilha.pop()
-            
-            for predecessor in predecessores[vertice_pilha]:
-                if contagem_caminhos[vertice_pilha] != 0:
-                    peso = (contagem_caminhos[predecessor] / contagem_caminhos[vertice_pilha])
-                    dependencia[predecessor] += peso * (1 + dependencia[vertice_pilha])
-            
-            if vertice_pilha != origem:
-                centralidade[vertice_pilha] += dependencia[vertice_pilha]
-                
+                    distancias[vizinho] = proxima_distancia
+                    ordem.append(vizinho)
+                if distancias[vizinho] == proxima_distancia:
+                    contagem_caminhos[vizinho] += caminhos_atual
+
+        for vertice_atual in reversed(ordem):
+            proxima_distancia = distancias[vertice_atual] + 1
+            acumulado = 0.0
+            for vizinho in targets[offsets[vertice_atual]:offsets[vertice_atual + 1]]:
+                if distancias[vizinho] == proxima_distancia:
+                    acumulado += (1.0 + dependencia[vizinho]) / contagem_caminhos[vizinho]
+            dependencia[vertice_atual] = contagem_caminhos[vertice_atual] * acumulado
+            if vertice_atual != origem:
+                parcial[vertice_atual] += dependencia[vertice_atual]
+
+        for vertice_atual in ordem:
+            distancias[vertice_atual] = -1
+            contagem_caminhos[vertice_atual] = 0.0
+            dependencia[vertice_atual] = 0.0
+
+    return parcial
+
+
+def brandes_weighted_partial(offsets, targets, custos, origens, buffers, parcial):
+    distancias, contagem_caminhos, dependencia = buffers
+
+    for origem in origens:
+        distancias[origem] = 0.0
+        contagem_caminhos[origem] = 1.0
+        tocados = [origem]
+        ordem = []
+        heap = [(0.0, origem)]
+
+        while heap:
+            distancia_atual, vertice_atual = heapq.heappop(heap)
+            if distancia_atual > distancias[vertice_atual]:
+                continue
+            ordem.append(vertice_atual)
+            caminhos_atual = contagem_caminhos[vertice_atual]
+            for indice in range(offsets[vertice_atual], offsets[vertice_atual + 1]):
+                vizinho = targets[indice]
+                nova_distancia = distancia_atual + custos[indice]
+                distancia_vizinho = distancias[vizinho]
+                if nova_distancia < distancia_vizinho:
+                    if distancia_vizinho == math.inf:
+                        tocados.append(vizinho)
+                    distancias[vizinho] = nova_distancia
+                    contagem_caminhos[vizinho] = caminhos_atual
+                    heapq.heappush(heap, (nova_distancia, vizinho))
+                elif nova_distancia == distancia_vizinho:
+                    contagem_caminhos[vizinho] += caminhos_atual
+
+        for vertice_atual in reversed(ordem):
+            distancia_atual = distancias[vertice_atual]
+            acumulado = 0.0
+            for indice in range(offsets[vertice_atual], offsets[vertice_atual + 1]):
+                vizinho = targets[indice]
+                if distancias[vizinho] == distancia_atual + custos[indice]:
+                    acumulado += (1.0 + dependencia[vizinho]) / contagem_caminhos[vizinho]
+            dependencia[vertice_atual] = contagem_caminhos[vertice_atual] * acumulado
+            if vertice_atual != origem:
+                parcial[vertice_atual] += dependencia[vertice_atual]
+
+        for vertice_atual in tocados:
+            distancias[vertice_atual] = math.inf
+            contagem_caminhos[vertice_atual] = 0.0
+            dependencia[vertice_atual] = 0.0
+
+    return parcial
+
+
+def brandes_buffers(numero_vertices, ponderado=False):
+    distancia_inicial = math.inf if ponderado else -1
+    return [distancia_inicial] * numero_vertices, [0.0] * numero_vertices, [0.0] * numero_vertices
+
+
+def _betweenness_worker_task(nome_memoria, numero_vertices, numero_arestas, ponderado, origens):
+    memoria = shared_memory.SharedMemory(name=nome_memoria)
+    visao = memoria.buf.cast("q")
+    offsets = visao[:numero_vertices + 1]
+    targets = visao[numero_vertices + 1:numero_vertices + 1 + numero_arestas]
+    custos = None
+    try:
+        parcial = [0.0] * numero_vertices
+        buffers = brandes_buffers(numero_vertices, ponderado)
+        if ponderado:
+            inicio_custos = 8 * (numero_vertices + 1 + numero_arestas)
+            custos = memoria.buf[inicio_custos:inicio_custos + 8 * numero_arestas].cast("d")
+            brandes_weighted_partial(offsets, targets, custos, origens, buffers, parcial)
+        else:
+            brandes_partial(offsets, targets, origens, buffers, parcial)
+        return parcial
+    finally:
+        if custos is not None:
+            custos.release()
+        offsets.release()
+        targets.release()
+        visao.release()
+        memoria.close()
+
+
+def betweenness_source_chunks(origens):
+    origens = list(origens)
+    tamanho = max(BETWEENNESS_CHUNK_SIZE, -(-len(origens) // BETWEENNESS_MAX_CHUNKS))
+    return [origens[inicio:inicio + tamanho] for inicio in range(0, len(origens), tamanho)]
+
+
+def betweenness_shared_memory(offsets, targets, numero_vertices, custos=None):
+    numero_arestas = len(targets)
+    tamanho = 8 * (numero_vertices + 1 + numero_arestas) + (8 * numero_arestas if custos is not None else 0)
+    memoria = shared_memory.SharedMemory(create=True, size=max(tamanho, 1))
+    try:
+        visao = memoria.buf.cast("q")
+        visao[:numero_vertices + 1] = offsets
+        visao[numero_vertices + 1:numero_vertices + 1 + numero_arestas] = targets
+        visao.release()
+        if custos is not None:
+            inicio_custos = 8 * (numero_vertices + 1 + numero_arestas)
+            visao_custos = memoria.buf[inicio_custos:inicio_custos + 8 * numero_arestas].cast("d")
+            visao_custos[:] = custos
+            visao_custos.release()
+    except BaseException:
+        memoria.close()
+        memoria.unlink()
+        raise
+    return memoria
+
+
+def _add_partial(totais, parcial):
+    for v in range(len(totais)):
+        totais[v] += parcial[v]
+
+
+def accumulate_partials(numero_vertices, parciais):
+    totais = [0.0] * numero_vertices
+    for parcial in parciais:
+        _add_partial(totais, parcial)
+    return totais
+
+
+def betweenness_from_totals(totais, numero_vertices):
+    centralidade = {v: totais[v] for v in range(numero_vertices)}
     if numero_vertices > 2:
         escala = 1.0 / ((numero_vertices - 1) * (numero_vertices - 2))
         for v in centralidade:
             centralidade[v] *= escala
-            
     return centralidade
 
 
-def pagerank(graph: AdjacencyListGraph, alpha=0.85, max_iter=100, tol=1.0e-6):
+def brandes_totals(offsets, targets, numero_vertices, origens, workers=1, custos=None):
+    blocos = betweenness_source_chunks(origens)
+    ponderado = custos is not None
+    numero_processos = min(workers or os.cpu_count() or 1, len(blocos))
+
+    if numero_processos > 1:
+        memoria = betweenness_shared_memory(offsets, targets, numero_vertices, custos)
+        argumentos = (memoria.name, numero_vertices, len(targets), ponderado)
+        try:
+            with ProcessPoolExecutor(max_workers=numero_processos) as executor:
+                tarefas = [executor.submit(_betweenness_worker_task, *argumentos, bloco) for bloco in blocos]
+                return accumulate_partials(numero_vertices, (tarefa.result() for tarefa in tarefas))
+        finally:
+            memoria.close()
+            memoria.unlink()
+
+    buffers = brandes_buffers(numero_vertices, ponderado)
+
+    def parciais():
+        for bloco in blocos:
+            parcial = [0.0] * numero_vertices
+            if ponderado:
+                brandes_weighted_partial(offsets, targets, custos, bloco, buffers, parcial)
+            else:
+                brandes_partial(offsets, targets, bloco, buffers, parcial)
+            yield parcial
+
+    return accumulate_partials(numero_vertices, parciais())
+
+
+@METRIC_CACHE.memoize(persistent=True, ignore=("workers",))
+def betweenness_centrality(graph: AbstractGraph, workers=1):
     numero_vertices = graph.getVertexCount()
-    
     if numero_vertices == 0:
         return {}
-        
-    pagerank_atual = {i: 1.0 / numero_vertices for i in range(numero_vertices)}
-    
-    graus_saida = {i: graph.getVertexOutDegree(i) for i in range(numero_vertices)}
-    
-    for _ in range(max_iter):
-        valor_base = (1 - alpha) / numero_vertices
-        novo_pagerank = {i: valor_base for i in range(numero_vertices)}
-        
-        for vertice_origem in range(numero_vertices):
-            if graus_saida[vertice_origem] == 0:
-                continue
-            
-            valor_compartilhado = pagerank_atual[vertice_origem] / graus_saida[vertice_origem]
-            
-            for vizinho in graph._adjacency[vertice_origem].keys():
-                novo_pagerank[vizinho] += alpha * valor_compartilhado
-                
-        diferenca_total = sum(abs(novo_pagerank[i] - pagerank_atual[i]) for i in range(numero_vertices))
-        
-        pagerank_atual = novo_pagerank
-        
+
+    offsets, targets = csr_arrays(graph)
+    totais = brandes_totals(offsets, targets, numero_vertices, range(numero_vertices), workers)
+    return betweenness_from_totals(totais, numero_vertices)
+
+
+@METRIC_CACHE.memoize(persistent=True, ignore=("workers",))
+def weighted_betweenness_centrality(graph: AbstractGraph, weight_to_distance=inverse_weight, workers=1):
+    numero_vertices = graph.getVertexCount()
+    if numero_vertices == 0:
+        return {}
+
+    offsets, targets, custos = csr_weighted_arrays(graph, weight_to_distance)
+    totais = brandes_totals(offsets, targets, numero_vertices, range(numero_vertices), workers, custos)
+    return betweenness_from_totals(totais, numero_vertices)
+
+
+def betweenness_sample_size(numero_vertices, epsilon, delta):
+    if numero_vertices < 3:
+        return numero_vertices
+    amplitude = numero_vertices / (numero_vertices - 1)
+    amostras = math.ceil(amplitude ** 2 * math.log(2 * numero_vertices / delta) / (2 * epsilon ** 2))
+    return min(numero_vertices, amostras)
+
+
+def betweenness_error_bound(numero_vertices, amostras, delta):
+    if amostras >= numero_vertices or numero_vertices < 3:
+        return 0.0
+    amplitude = numero_vertices / (numero_vertices - 1)
+    return amplitude * math.sqrt(math.log(2 * numero_vertices / delta) / (2 * amostras))
+
+
+def approximate_betweenness_centrality(graph: AbstractGraph, samples=None, epsilon=None, delta=0.1, seed=None, workers=1):
+    numero_vertices = graph.getVertexCount()
+    if numero_vertices == 0:
+        return {}, 0.0
+    if not 0 < delta < 1:
+        raise ValueError("delta deve estar entre 0 e 1")
+
+    if samples is None:
+        if epsilon is None or epsilon <= 0:
+            raise ValueError("Informe samples ou um epsilon positivo")
+        samples = betweenness_sample_size(numero_vertices, epsilon, delta)
+    if samples <= 0:
+        raise ValueError("Número de amostras deve ser positivo")
+    samples = min(samples, numero_vertices)
+
+    gerador = random.Random(seed)
+    pivos = sorted(gerador.sample(range(numero_vertices), samples))
+
+    offsets, targets = csr_arrays(graph)
+    totais = brandes_totals(offsets, targets, numero_vertices, pivos, workers)
+
+    escala = numero_vertices / samples
+    if numero_vertices > 2:
+        escala /= (numero_vertices - 1) * (numero_vertices - 2)
+    centralidade = {v: totais[v] * escala for v in range(numero_vertices)}
+
+    return centralidade, betweenness_error_bound(numero_vertices, samples, delta)
+
+
+@METRIC_CACHE.memoize()
+def pagerank_transitions(graph: AbstractGraph, weighted=False):
+    numero_vertices = graph.getVertexCount()
+    if isinstance(graph, CSRGraph):
+        offsets, targets, pesos = graph._offsets, graph._targets, graph._weights
+    else:
+        offsets = array("q", [0])
+        targets = array("q")
+        pesos = array("d")
+        for vertice in range(numero_vertices):
+            for vizinho, peso in graph.getWeightedSuccessors(vertice):
+                targets.append(vizinho)
+                pesos.append(peso)
+            offsets.append(len(targets))
+
+    saida = [0.0] * numero_vertices
+    graus_entrada = [0] * (numero_vertices + 1)
+    for vertice in range(numero_vertices):
+        for indice in range(offsets[vertice], offsets[vertice + 1]):
+            peso = pesos[indice] if weighted else 1.0
+            if weighted and not peso >= 0:
+                raise ValueError("Pesos de transição devem ser não negativos")
+            saida[vertice] += peso
+            graus_entrada[targets[indice] + 1] += 1
+
+    offsets_entrada = array("q", graus_entrada)
+    for vertice in range(numero_vertices):
+        offsets_entrada[vertice + 1] += offsets_entrada[vertice]
+    origens = array("q", bytes(8 * len(targets)))
+    probabilidades = array("d", bytes(8 * len(targets)))
+    cursor = array("q", offsets_entrada)
+    for vertice in range(numero_vertices):
+        if saida[vertice] == 0:
+            continue
+        for indice in range(offsets[vertice], offsets[vertice + 1]):
+            destino = targets[indice]
+            posicao = cursor[destino]
+            cursor[destino] = posicao + 1
+            origens[posicao] = vertice
+            probabilidades[posicao] = (pesos[indice] if weighted else 1.0) / saida[vertice]
+
+    pendentes = [vertice for vertice in range(numero_vertices) if saida[vertice] == 0]
+    return offsets_entrada, origens, probabilidades, pendentes
+
+
+def _normalized_vector(valores, numero_vertices, mensagem):
+    if isinstance(valores, dict):
+        vetor = [0.0] * numero_vertices
+        for vertice, valor in valores.items():
+            vetor[vertice] = float(valor)
+    else:
+        if len(valores) != numero_vertices:
+            raise ValueError(mensagem)
+        vetor = [float(valor) for valor in valores]
+    total = sum(vetor)
+    if not total > 0 or any(valor < 0 for valor in vetor):
+        raise ValueError(mensagem)
+    return [valor / total for valor in vetor]
+
+
+def pagerank_power(transicoes, alpha=0.85, max_iter=100, tol=1.0e-6, personalization=None, initial=None):
+    offsets_entrada, origens, probabilidades, pendentes = transicoes
+    numero_vertices = len(offsets_entrada) - 1
+    if numero_vertices == 0:
+        return [], 0
+
+    if personalization is None:
+        teleporte = [1.0 / numero_vertices] * numero_vertices
+    else:
+        teleporte = _normalized_vector(personalization, numero_vertices, "Vetor de personalização inválido")
+    if initial is None:
+        atual = list(teleporte)
+    else:
+        atual = _normalized_vector(initial, numero_vertices, "Vetor inicial inválido")
+
+    multiplicar = operator.mul
+    iteracoes = 0
+    for iteracoes in range(1, max_iter + 1):
+        massa_pendente = sum(atual[vertice] for vertice in pendentes)
+        fator_teleporte = 1.0 - alpha + alpha * massa_pendente
+        ler = atual.__getitem__
+        novo = [
+            fator_teleporte * teleporte[vertice]
+            + alpha * sum(map(
+                multiplicar,
+                probabilidades[offsets_entrada[vertice]:offsets_entrada[vertice + 1]],
+                map(ler, origens[offsets_entrada[vertice]:offsets_entrada[vertice + 1]]),
+            ))
+            for vertice in range(numero_vertices)
+        ]
+        diferenca_total = sum(map(abs, map(operator.sub, novo, atual)))
+        atual = novo
         if diferenca_total < tol:
             break
-            
-    return pagerank_atual
+
+    return atual, iteracoes
+
+
+def pagerank(
+    graph: AbstractGraph,
+    alpha=0.85,
+    max_iter=100,
+    tol=1.0e-6,
+    weighted=False,
+    personalization=None,
+    initial=None,
+    transitions=None,
+):
+    if graph.getVertexCount() == 0:
+        return {}
+    if transitions is None:
+        transitions = pagerank_transitions(graph, weighted)
+    valores, _ = pagerank_power(transitions, alpha, max_iter, tol, personalization, initial)
+    return dict(enumerate(valores))
 
 
-def undirected_neighbors(graph: AdjacencyListGraph):
+@METRIC_CACHE.memoize()
+def undirected_neighbors(graph: AbstractGraph):
     numero_vertices = graph.getVertexCount()
     
     vizinhos_nao_direcionados = [set() for _ in range(numero_vertices)]
     
     for vertice_origem in range(numero_vertices):
-        for vertice_destino in graph._adjacency[vertice_origem].keys():
+        for vertice_destino in graph.getSuccessors(vertice_origem):
             vizinhos_nao_direcionados[vertice_origem].add(vertice_destino)
             vizinhos_nao_direcionados[vertice_destino].add(vertice_origem)
             
     return vizinhos_nao_direcionados
 
 
-def clustering_coefficients(graph: AdjacencyListGraph):
+@METRIC_CACHE.memoize(ignore=("vizinhos_por_vertice",))
+def triangle_statistics(graph: AbstractGraph, vizinhos_por_vertice=None):
     numero_vertices = graph.getVertexCount()
-    
+    sucessores = [set(graph.getSuccessors(vertice)) for vertice in range(numero_vertices)]
+    if vizinhos_por_vertice is None:
+        vizinhos_por_vertice = undirected_neighbors(graph)
+
+    ordem = sorted(range(numero_vertices), key=lambda vertice: len(vizinhos_por_vertice[vertice]))
+    posicao = [0] * numero_vertices
+    for indice, vertice in enumerate(ordem):
+        posicao[vertice] = indice
+    orientados = [
+        frozenset(vizinho for vizinho in vizinhos_por_vertice[vertice] if posicao[vizinho] > posicao[vertice])
+        for vertice in range(numero_vertices)
+    ]
+
+    triangulos = [0] * numero_vertices
+    ciclos = [0] * numero_vertices
+    intermediarios = [0] * numero_vertices
+    entradas = [0] * numero_vertices
+    saidas = [0] * numero_vertices
+
+    def contar_direcionados(i, j, h):
+        for a, b in ((j, h), (h, j)):
+            ij = a in sucessores[i]
+            ji = i in sucessores[a]
+            ih = b in sucessores[i]
+            hi = i in sucessores[b]
+            jh = b in sucessores[a]
+            hj = a in sucessores[b]
+            ciclos[i] += ij and jh and hi
+            intermediarios[i] += ij and hj and hi
+            entradas[i] += ji and jh and hi
+            saidas[i] += ij and jh and ih
+
+    for u in range(numero_vertices):
+        orientados_u = orientados[u]
+        for v in orientados_u:
+            for w in orientados_u & orientados[v]:
+                triangulos[u] += 1
+                triangulos[v] += 1
+                triangulos[w] += 1
+                contar_direcionados(u, v, w)
+                contar_direcionados(v, u, w)
+                contar_direcionados(w, u, v)
+
+    return triangulos, ciclos, intermediarios, entradas, saidas
+
+
+def vertex_triangles(graph: AbstractGraph, estatisticas=None):
+    if estatisticas is None:
+        estatisticas = triangle_statistics(graph)
+    return dict(enumerate(estatisticas[0]))
+
+
+def clustering_coefficients(graph: AbstractGraph, estatisticas=None):
+    numero_vertices = graph.getVertexCount()
+    if estatisticas is None:
+        estatisticas = triangle_statistics(graph)
+    triangulos = estatisticas[0]
     vizinhos_por_vertice = undirected_neighbors(graph)
-    
     coeficientes = {}
-    
+
     for vertice_atual in range(numero_vertices):
         quantidade_vizinhos = len(vizinhos_por_vertice[vertice_atual])
-        
         if quantidade_vizinhos < 2:
             coeficientes[vertice_atual] = 0.0
             continue
-            
-        lista_de_vizinhos = list(vizinhos_por_vertice[vertice_atual])
-        conexoes_entre_vizinhos = 0
-        
-        for i in range(quantidade_vizinhos):
-            vizinho_um = lista_de_vizinhos[i]
-            
-            for j in range(i + 1, quantidade_vizinhos):
-                vizinho_dois = lista_de_vizinhos[j]
-                
-                if vizinho_dois in vizinhos_por_vertice[vizinho_um]:
-                    conexoes_entre_vizinhos += 1
-                    
-        coeficientes[vertice_atual] = 2 * conexoes_entre_vizinhos / (quantidade_vizinhos * (quantidade_vizinhos - 1))
-        
+        coeficientes[vertice_atual] = 2 * triangulos[vertice_atual] / (quantidade_vizinhos * (quantidade_vizinhos - 1))
+
     return coeficientes
 
 
-def density(graph: AdjacencyListGraph):
+def transitivity(graph: AbstractGraph, estatisticas=None):
+    if estatisticas is None:
+        estatisticas = triangle_statistics(graph)
+    triangulos = sum(estatisticas[0])
+    triplas = sum(len(vizinhos) * (len(vizinhos) - 1) // 2 for vizinhos in undirected_neighbors(graph))
+    if triplas == 0:
+        return 0.0
+    return triangulos / triplas
+
+
+def directed_clustering_coefficients(graph: AbstractGraph, estatisticas=None):
+    numero_vertices = graph.getVertexCount()
+    if estatisticas is None:
+        estatisticas = triangle_statistics(graph)
+    _, ciclos, intermediarios, entradas, saidas = estatisticas
+    coeficientes = {"cycle": {}, "middleman": {}, "in": {}, "out": {}}
+
+    for vertice_atual in range(numero_vertices):
+        grau_entrada = graph.getVertexInDegree(vertice_atual)
+        grau_saida = graph.getVertexOutDegree(vertice_atual)
+        predecessores = set(graph.getPredecessors(vertice_atual))
+        reciprocos = sum(1 for vizinho in graph.getSuccessors(vertice_atual) if vizinho in predecessores)
+        pares_mistos = grau_entrada * grau_saida - reciprocos
+        pares_entrada = grau_entrada * (grau_entrada - 1)
+        pares_saida = grau_saida * (grau_saida - 1)
+        coeficientes["cycle"][vertice_atual] = ciclos[vertice_atual] / pares_mistos if pares_mistos else 0.0
+        coeficientes["middleman"][vertice_atual] = intermediarios[vertice_atual] / pares_mistos if pares_mistos else 0.0
+        coeficientes["in"][vertice_atual] = entradas[vertice_atual] / pares_entrada if pares_entrada else 0.0
+        coeficientes["out"][vertice_atual] = saidas[vertice_atual] / pares_saida if pares_saida else 0.0
+
+    return coeficientes
+
+
+def density(graph: AbstractGraph):
     numero_vertices = graph.getVertexCount()
     numero_arestas = graph.getEdgeCount()
     
@@ -179,7 +751,7 @@ def density(graph: AdjacencyListGraph):
     return numero_arestas / (numero_vertices * (numero_vertices - 1))
 
 
-def assortativity_degree(graph: AdjacencyListGraph):
+def assortativity_degree(graph: AbstractGraph):
     vizinhos = undirected_neighbors(graph)
     numero_vertices = graph.getVertexCount()
     
@@ -220,7 +792,11 @@ def assortativity_degree(graph: AdjacencyListGraph):
     return covariancia / math.sqrt(variancia_x * variancia_y)
 
 
-def communities_connected_components(graph: AdjacencyListGraph):
+@METRIC_CACHE.memoize()
+def communities_connected_components(graph: AbstractGraph):
+    if graph.isConnectivityTracked():
+        return graph.getComponents()
+
     numero_vertices = graph.getVertexCount()
     vizinhos_por_vertice = undirected_neighbors(graph)
     
@@ -247,45 +823,897 @@ def communities_connected_components(graph: AdjacencyListGraph):
     return comunidades
 
 
+def _undirected_bfs(vizinhos_por_vertice, origem, distancias):
+    distancias[origem] = 0
+    visitados = [origem]
+    fila = deque(visitados)
+    while fila:
+        vertice_atual = fila.popleft()
+        proxima_distancia = distancias[vertice_atual] + 1
+        for vizinho in vizinhos_por_vertice[vertice_atual]:
+            if distancias[vizinho] < 0:
+                distancias[vizinho] = proxima_distancia
+                visitados.append(vizinho)
+                fila.append(vizinho)
+    return visitados
+
+
+def _bounding_eccentricities(vizinhos_por_vertice, componente, distancias, excentricidades):
+    inferiores = {vertice: 0 for vertice in componente}
+    superiores = {vertice: math.inf for vertice in componente}
+    candidatos = set(componente)
+    buscas = 0
+    escolher_superior = True
+
+    while candidatos:
+        if escolher_superior:
+            origem = max(candidatos, key=lambda v: (superiores[v], len(vizinhos_por_vertice[v]), -v))
+        else:
+            origem = min(candidatos, key=lambda v: (inferiores[v], -len(vizinhos_por_vertice[v]), v))
+        escolher_superior = not escolher_superior
+
+        visitados = _undirected_bfs(vizinhos_por_vertice, origem, distancias)
+        buscas += 1
+        excentricidade = distancias[visitados[-1]]
+        excentricidades[origem] = excentricidade
+        candidatos.discard(origem)
+
+        resolvidos = []
+        for vertice in candidatos:
+            distancia = distancias[vertice]
+            inferior = max(inferiores[vertice], excentricidade - distancia, distancia)
+            superior = min(superiores[vertice], excentricidade + distancia)
+            inferiores[vertice] = inferior
+            superiores[vertice] = superior
+            if inferior == superior:
+                excentricidades[vertice] = inferior
+                resolvidos.append(vertice)
+        candidatos.difference_update(resolvidos)
+
+        for vertice in visitados:
+            distancias[vertice] = -1
+
+    return buscas
+
+
+@METRIC_CACHE.memoize(ignore=("vizinhos_por_vertice", "componentes"))
+def distance_statistics_by_component(graph: AbstractGraph, vizinhos_por_vertice=None, componentes=None):
+    numero_vertices = graph.getVertexCount()
+    if vizinhos_por_vertice is None:
+        vizinhos_por_vertice = undirected_neighbors(graph)
+    if componentes is None:
+        componentes = communities_connected_components(graph)
+    distancias = [-1] * numero_vertices
+    excentricidades = [0] * numero_vertices
+    estatisticas = []
+
+    for componente in sorted(componentes, key=lambda grupo: (-len(grupo), min(grupo))):
+        buscas = 0
+        if len(componente) > 1:
+            buscas = _bounding_eccentricities(vizinhos_por_vertice, componente, distancias, excentricidades)
+        valores = [excentricidades[vertice] for vertice in componente]
+        diametro_componente = max(valores)
+        raio_componente = min(valores)
+        estatisticas.append({
+            "vertices": sorted(componente),
+            "diameter": diametro_componente,
+            "radius": raio_componente,
+            "periphery": sorted(v for v in componente if excentricidades[v] == diametro_componente),
+            "center": sorted(v for v in componente if excentricidades[v] == raio_componente),
+            "bfs_runs": buscas,
+        })
+
+    return excentricidades, estatisticas
+
+
+def eccentricities(graph: AbstractGraph):
+    return dict(enumerate(distance_statistics_by_component(graph)[0]))
+
+
+def _largest_component_statistics(graph: AbstractGraph):
+    estatisticas = distance_statistics_by_component(graph)[1]
+    return estatisticas[0] if estatisticas else None
+
+
+def diameter(graph: AbstractGraph):
+    maior_componente = _largest_component_statistics(graph)
+    return maior_componente["diameter"] if maior_componente else 0
+
+
+def radius(graph: AbstractGraph):
+    maior_componente = _largest_component_statistics(graph)
+    return maior_componente["radius"] if maior_componente else 0
+
+
+def periphery(graph: AbstractGraph):
+    maior_componente = _largest_component_statistics(graph)
+    return maior_componente["periphery"] if maior_componente else []
+
+
+def average_path_length_estimate(graph: AbstractGraph, samples=64, seed=None, vizinhos_por_vertice=None):
+    numero_vertices = graph.getVertexCount()
+    if numero_vertices < 2:
+        return 0.0, 0.0
+    if vizinhos_por_vertice is None:
+        vizinhos_por_vertice = undirected_neighbors(graph)
+    gerador = random.Random(seed)
+    origens = gerador.sample(range(numero_vertices), min(samples, numero_vertices))
+    distancias = [-1] * numero_vertices
+
+    soma_total = 0
+    pares_total = 0
+    medias = []
+    for origem in origens:
+        visitados = _undirected_bfs(vizinhos_por_vertice, origem, distancias)
+        soma = sum(distancias[vertice] for vertice in visitados)
+        if len(visitados) > 1:
+            soma_total += soma
+            pares_total += len(visitados) - 1
+            medias.append(soma / (len(visitados) - 1))
+        for vertice in visitados:
+            distancias[vertice] = -1
+
+    if pares_total == 0:
+        return 0.0, 0.0
+    estimativa = soma_total / pares_total
+    if len(medias) < 2:
+        return estimativa, 0.0
+    media = sum(medias) / len(medias)
+    variancia = sum((valor - media) ** 2 for valor in medias) / (len(medias) - 1)
+    return estimativa, math.sqrt(variancia / len(medias))
+
+
+def scc_reachability_counts(graph: AbstractGraph, componentes=None):
+    if componentes is None:
+        componentes = stronglyConnectedComponentIds(graph)
+    dag, pertinencia = condensation(graph, componentes)
+    numero_componentes = dag.getVertexCount()
+
+    alcance = [0] * numero_componentes
+    for vertice in range(graph.getVertexCount()):
+        alcance[pertinencia[vertice]] |= 1 << vertice
+    for componente in reversed(range(numero_componentes)):
+        for sucessor in dag.getSuccessors(componente):
+            alcance[componente] |= alcance[sucessor]
+
+    return {
+        vertice: alcance[pertinencia[vertice]].bit_count() - 1
+        for vertice in range(graph.getVertexCount())
+    }
+
+
+def scc_closeness_centrality(graph: AbstractGraph, componentes=None):
+    if componentes is None:
+        componentes = stronglyConnectedComponentIds(graph)
+    centralidade = {vertice: 0.0 for vertice in range(graph.getVertexCount())}
+
+    for grupo in _group_communities(componentes[0]):
+        if len(grupo) < 2:
+            continue
+        visao = SubgraphView(graph, grupo)
+        alcancaveis, somas_distancias, _ = msbfs_statistics(visao)
+        for local, vertice in enumerate(grupo):
+            centralidade[vertice] = alcancaveis[local] / somas_distancias[local]
+
+    return centralidade
+
+
+@METRIC_CACHE.memoize()
+def undirected_weighted_arrays(graph: AbstractGraph):
+    numero_vertices = graph.getVertexCount()
+    linhas = [{} for _ in range(numero_vertices)]
+    for vertice in range(numero_vertices):
+        for vizinho, peso in graph.getWeightedSuccessors(vertice):
+            linhas[vertice][vizinho] = linhas[vertice].get(vizinho, 0.0) + peso
+            linhas[vizinho][vertice] = linhas[vizinho].get(vertice, 0.0) + peso
+    return _rows_to_csr(linhas)
+
+
+def _rows_to_csr(linhas):
+    offsets = array("q", [0])
+    targets = array("q")
+    pesos = array("d")
+    for linha in linhas:
+        targets.extend(linha.keys())
+        pesos.extend(linha.values())
+        offsets.append(len(targets))
+    return offsets, targets, pesos
+
+
+def _group_communities(rotulos):
+    grupos = {}
+    for vertice, rotulo in enumerate(rotulos):
+        grupos.setdefault(rotulo, []).append(vertice)
+    return sorted(grupos.values(), key=lambda grupo: (-len(grupo), grupo[0]))
+
+
+def community_membership(comunidades, numero_vertices):
+    pertinencia = [-1] * numero_vertices
+    for indice, comunidade in enumerate(comunidades):
+        for vertice in comunidade:
+            pertinencia[vertice] = indice
+    return pertinencia
+
+
+def community_sizes(comunidades):
+    return [len(comunidade) for comunidade in comunidades]
+
+
+def modularity(graph: AbstractGraph, comunidades, resolution=1.0, arestas=None):
+    offsets, targets, pesos = undirected_weighted_arrays(graph) if arestas is None else arestas
+    numero_vertices = graph.getVertexCount()
+    pertinencia = community_membership(comunidades, numero_vertices)
+    peso_total = sum(pesos)
+    if peso_total == 0:
+        return 0.0
+
+    numero_comunidades = len(comunidades)
+    for vertice in range(numero_vertices):
+        if pertinencia[vertice] < 0:
+            pertinencia[vertice] = numero_comunidades
+            numero_comunidades += 1
+
+    internos = [0.0] * numero_comunidades
+    totais = [0.0] * numero_comunidades
+    for vertice in range(numero_vertices):
+        comunidade = pertinencia[vertice]
+        for indice in range(offsets[vertice], offsets[vertice + 1]):
+            totais[comunidade] += pesos[indice]
+            if pertinencia[targets[indice]] == comunidade:
+                internos[comunidade] += pesos[indice]
+
+    return sum(
+        interno / peso_total - resolution * (total / peso_total) ** 2
+        for interno, total in zip(internos, totais)
+    )
+
+
+def _louvain_local_moving(offsets, targets, pesos, graus, peso_total, resolucao, gerador):
+    numero_vertices = len(graus)
+    comunidade = list(range(numero_vertices))
+    totais = list(graus)
+    peso_para = [0.0] * numero_vertices
+    marca = [-1] * numero_vertices
+    ordem = list(range(numero_vertices))
+    gerador.shuffle(ordem)
+    houve_movimento = False
+
+    melhorou = True
+    while melhorou:
+        melhorou = False
+        for vertice in ordem:
+            atual = comunidade[vertice]
+            vistas = [atual]
+            marca[atual] = vertice
+            for indice in range(offsets[vertice], offsets[vertice + 1]):
+                vizinho = targets[indice]
+                if vizinho == vertice:
+                    continue
+                destino = comunidade[vizinho]
+                if marca[destino] != vertice:
+                    marca[destino] = vertice
+                    vistas.append(destino)
+                peso_para[destino] += pesos[indice]
+
+            grau = graus[vertice]
+            totais[atual] -= grau
+            fator = resolucao * grau / peso_total
+            melhor = atual
+            melhor_ganho = peso_para[atual] - totais[atual] * fator
+            for destino in vistas:
+                ganho = peso_para[destino] - totais[destino] * fator
+                if ganho > melhor_ganho:
+                    melhor = destino
+                    melhor_ganho = ganho
+                peso_para[destino] = 0.0
+            totais[melhor] += grau
+
+            if melhor != atual:
+                comunidade[vertice] = melhor
+                melhorou = True
+                houve_movimento = True
+
+    return comunidade, houve_movimento
+
+
+def louvain_communities(graph: AbstractGraph, resolution=1.0, seed=None, arestas=None):
+    numero_vertices = graph.getVertexCount()
+    offsets, targets, pesos = undirected_weighted_arrays(graph) if arestas is None else arestas
+    peso_total = sum(pesos)
+    pertinencia = list(range(numero_vertices))
+    if peso_total == 0:
+        return _group_communities(pertinencia)
+
+    gerador = random.Random(seed)
+    graus = [sum(pesos[offsets[v]:offsets[v + 1]]) for v in range(numero_vertices)]
+
+    while True:
+        comunidade, houve_movimento = _louvain_local_moving(offsets, targets, pesos, graus, peso_total, resolution, gerador)
+        if not houve_movimento:
+            break
+
+        renumeracao = {}
+        for rotulo in comunidade:
+            if rotulo not in renumeracao:
+                renumeracao[rotulo] = len(renumeracao)
+        novo_indice = [renumeracao[rotulo] for rotulo in comunidade]
+        pertinencia = [novo_indice[no] for no in pertinencia]
+
+        linhas = [{} for _ in range(len(renumeracao))]
+        novos_graus = [0.0] * len(renumeracao)
+        for no in range(len(graus)):
+            origem = novo_indice[no]
+            linha = linhas[origem]
+            novos_graus[origem] += graus[no]
+            for indice in range(offsets[no], offsets[no + 1]):
+                destino = novo_indice[targets[indice]]
+                linha[destino] = linha.get(destino, 0.0) + pesos[indice]
+        offsets, targets, pesos = _rows_to_csr(linhas)
+        graus = novos_graus
+
+    return _group_communities(pertinencia)
+
+
+def label_propagation_communities(graph: AbstractGraph, max_iter=100, seed=None, arestas=None):
+    numero_vertices = graph.getVertexCount()
+    offsets, targets, pesos = undirected_weighted_arrays(graph) if arestas is None else arestas
+    rotulos = list(range(numero_vertices))
+    gerador = random.Random(seed)
+    ordem = list(range(numero_vertices))
+
+    for _ in range(max_iter):
+        gerador.shuffle(ordem)
+        mudou = False
+        for vertice in ordem:
+            inicio, fim = offsets[vertice], offsets[vertice + 1]
+            if inicio == fim:
+                continue
+            votos = {}
+            for indice in range(inicio, fim):
+                rotulo = rotulos[targets[indice]]
+                votos[rotulo] = votos.get(rotulo, 0.0) + pesos[indice]
+            maior = max(votos.values())
+            candidatos = [rotulo for rotulo, voto in votos.items() if voto == maior]
+            if rotulos[vertice] in candidatos:
+                continue
+            rotulos[vertice] = candidatos[0] if len(candidatos) == 1 else gerador.choice(candidatos)
+            mudou = True
+        if not mudou:
+            break
+
+    return _group_communities(rotulos)
+
+
+def detect_communities(graph: AbstractGraph, method="louvain", resolution=1.0, seed=None, arestas=None):
+    if arestas is None:
+        arestas = undirected_weighted_arrays(graph)
+    if method == "louvain":
+        comunidades = louvain_communities(graph, resolution, seed, arestas)
+    elif method == "label_propagation":
+        comunidades = label_propagation_communities(graph, seed=seed, arestas=arestas)
+    else:
+        raise ValueError("Método de detecção de comunidades inválido")
+    return comunidades, modularity(graph, comunidades, resolution, arestas), community_sizes(comunidades)
+
+
+METRIC_PIPELINE = {
+    "undirected_neighbors": ((), False, undirected_neighbors),
+    "degrees": ((), False, compute_degrees),
+    "density": ((), False, density),
+    "msbfs": ((), True, msbfs_statistics),
+    "closeness": (("msbfs",), False, lambda graph, estatisticas: closeness_from_statistics(estatisticas)),
+    "harmonic": (("msbfs",), False, lambda graph, estatisticas: dict(enumerate(estatisticas[2]))),
+    "reachability": (("msbfs",), False, lambda graph, estatisticas: dict(enumerate(estatisticas[0]))),
+    "betweenness": ((), True, betweenness_centrality),
+    "weighted_closeness": ((), True, weighted_closeness_centrality),
+    "weighted_betweenness": ((), True, weighted_betweenness_centrality),
+    "pagerank_transitions": ((), False, lambda graph: pagerank_transitions(graph, weighted=True)),
+    "pagerank": (("pagerank_transitions",), False, lambda graph, transicoes: pagerank(graph, transitions=transicoes)),
+    "triangles": (("undirected_neighbors",), True, triangle_statistics),
+    "clustering": (("triangles",), False, lambda graph, estatisticas: clustering_coefficients(graph, estatisticas)),
+    "transitivity": (("triangles",), False, lambda graph, estatisticas: transitivity(graph, estatisticas)),
+    "assortativity": (("undirected_neighbors",), False, lambda graph, vizinhos: assortativity_degree(graph)),
+    "components": ((), False, communities_connected_components),
+    "strong_components": ((), False, stronglyConnectedComponentIds),
+    "undirected_weighted_arrays": ((), False, undirected_weighted_arrays),
+    "communities": (
+        ("undirected_weighted_arrays",),
+        True,
+        lambda graph, arestas: detect_communities(graph, "louvain", seed=0, arestas=arestas),
+    ),
+    "distances": (("undirected_neighbors", "components"), True, distance_statistics_by_component),
+    "average_path_length": (
+        ("undirected_neighbors",),
+        False,
+        lambda graph, vizinhos: average_path_length_estimate(graph, seed=0, vizinhos_por_vertice=vizinhos),
+    ),
+}
+PARALLEL_METRICS = {
+    "betweenness": (betweenness_centrality, False),
+    "weighted_betweenness": (weighted_betweenness_centrality, True),
+}
+
+_PIPELINE_WORKER = {}
+
+
+def _pipeline_worker_init(graph):
+    _PIPELINE_WORKER["graph"] = graph
+
+
+def _pipeline_worker_task(nome, entradas):
+    return METRIC_PIPELINE[nome][2](_PIPELINE_WORKER["graph"], *entradas)
+
+
+def metric_dependencies(metricas):
+    ordem = []
+    visitadas = set()
+    for metrica in metricas:
+        if metrica not in METRIC_PIPELINE:
+            raise ValueError(f"Métrica desconhecida: {metrica}")
+        pilha = [(metrica, False)]
+        while pilha:
+            nome, expandida = pilha.pop()
+            if nome in visitadas:
+                continue
+            if expandida:
+                visitadas.add(nome)
+                ordem.append(nome)
+                continue
+            pilha.append((nome, True))
+            for entrada in METRIC_PIPELINE[nome][0]:
+                if entrada not in visitadas:
+                    pilha.append((entrada, False))
+    return ordem
+
+
+def _start_betweenness_job(graph, centralidade, ponderado):
+    nome_cache, parametros = centralidade.cacheKey(graph)
+    encontrado, valor = METRIC_CACHE.lookup(graph, nome_cache, parametros, centralidade.persistent)
+    numero_vertices = graph.getVertexCount()
+    if encontrado or numero_vertices == 0:
+        return {"resultado": valor if encontrado else centralidade(graph)}
+
+    if ponderado:
+        offsets, targets, custos = csr_weighted_arrays(graph, dict(parametros)["weight_to_distance"])
+    else:
+        (offsets, targets), custos = csr_arrays(graph), None
+    memoria = betweenness_shared_memory(offsets, targets, numero_vertices, custos)
+    return {
+        "cache": (nome_cache, parametros, centralidade.persistent),
+        "memoria": memoria,
+        "argumentos": (memoria.name, numero_vertices, len(targets), ponderado),
+        "blocos": betweenness_source_chunks(range(numero_vertices)),
+        "totais": [0.0] * numero_vertices,
+        "chegadas": {},
+        "proximo": 0,
+    }
+
+
+def _advance_betweenness_job(graph, trabalho, indice, parcial):
+    chegadas = trabalho["chegadas"]
+    chegadas[indice] = parcial
+    while trabalho["proximo"] in chegadas:
+        _add_partial(trabalho["totais"], chegadas.pop(trabalho["proximo"]))
+        trabalho["proximo"] += 1
+    if trabalho["proximo"] < len(trabalho["blocos"]):
+        return False
+
+    trabalho["memoria"].close()
+    trabalho["memoria"].unlink()
+    nome_cache, parametros, persistente = trabalho["cache"]
+    centralidade = betweenness_from_totals(trabalho["totais"], graph.getVertexCount())
+    METRIC_CACHE.insert(graph, nome_cache, parametros, dict(centralidade), persistente)
+    trabalho["resultado"] = centralidade
+    return True
+
+
+def run_metric_pipeline(graph: AbstractGraph, metrics=None, workers=1):
+    pedidas = list(METRIC_PIPELINE) if metrics is None else list(metrics)
+    pendentes = metric_dependencies(pedidas)
+    resultados = {}
+
+    if workers is not None and workers <= 1:
+        for nome in pendentes:
+            entradas, _, funcao = METRIC_PIPELINE[nome]
+            resultados[nome] = funcao(graph, *(resultados[entrada] for entrada in entradas))
+        return {nome: resultados[nome] for nome in pedidas}
+
+    if os.name == "posix" and any(nome in PARALLEL_METRICS for nome in pendentes):
+        # os processos do pool precisam herdar o rastreador de memória compartilhada do processo pai
+        resource_tracker.ensure_running()
+    trabalhos = {}
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_pipeline_worker_init, initargs=(graph,)) as executor:
+            em_execucao = {}
+            while pendentes or em_execucao:
+                prontas = [
+                    nome for nome in pendentes
+                    if all(entrada in resultados for entrada in METRIC_PIPELINE[nome][0])
+                ]
+                for nome in prontas:
+                    pendentes.remove(nome)
+                    entradas, pesada, funcao = METRIC_PIPELINE[nome]
+                    valores = [resultados[entrada] for entrada in entradas]
+                    if nome in PARALLEL_METRICS:
+                        trabalho = _start_betweenness_job(graph, *PARALLEL_METRICS[nome])
+                        if "resultado" in trabalho:
+                            resultados[nome] = trabalho["resultado"]
+                            continue
+                        trabalhos[nome] = trabalho
+                        for indice, bloco in enumerate(trabalho["blocos"]):
+                            futuro = executor.submit(_betweenness_worker_task, *trabalho["argumentos"], bloco)
+                            em_execucao[futuro] = (nome, indice)
+                    elif pesada:
+                        em_execucao[executor.submit(_pipeline_worker_task, nome, valores)] = nome
+                    else:
+                        resultados[nome] = funcao(graph, *valores)
+                if any(
+                    all(entrada in resultados for entrada in METRIC_PIPELINE[nome][0])
+                    for nome in pendentes
+                ):
+                    continue
+                if em_execucao:
+                    concluidas, _ = wait(em_execucao, return_when=FIRST_COMPLETED)
+                    for futuro in concluidas:
+                        tarefa = em_execucao.pop(futuro)
+                        if isinstance(tarefa, str):
+                            resultados[tarefa] = futuro.result()
+                            continue
+                        nome, indice = tarefa
+                        trabalho = trabalhos[nome]
+                        if _advance_betweenness_job(graph, trabalho, indice, futuro.result()):
+                            resultados[nome] = trabalho["resultado"]
+                            del trabalhos[nome]
+    finally:
+        for trabalho in trabalhos.values():
+            trabalho["memoria"].close()
+            trabalho["memoria"].unlink()
+
+    return {nome: resultados[nome] for nome in pedidas}
+
+
+class IncrementalAnalysis:
+    def __init__(self, graph: AbstractGraph, alpha=0.85, tol=1.0e-6, weighted=True):
+        if isinstance(graph, CSRGraph):
+            graph = toList(graph)
+        self.graph = graph
+        self.alpha = alpha
+        self.weighted = weighted
+        numero_vertices = graph.getVertexCount()
+        self._limiar = tol / max(numero_vertices, 1)
+
+        self.graus_entrada = [graph.getVertexInDegree(v) for v in range(numero_vertices)]
+        self.graus_saida = [graph.getVertexOutDegree(v) for v in range(numero_vertices)]
+
+        self.vizinhos = [set(vizinhos) for vizinhos in undirected_neighbors(graph)]
+        self.triangulos = list(triangle_statistics(graph)[0])
+        self.total_triangulos = sum(self.triangulos) // 3
+        self.total_triplas = sum(len(vizinhos) * (len(vizinhos) - 1) // 2 for vizinhos in self.vizinhos)
+        self.soma_clustering = sum(self._clustering(v) for v in range(numero_vertices))
+
+        self.estimativa = [0.0] * numero_vertices
+        self.residuo = [(1.0 - alpha) / numero_vertices] * numero_vertices if numero_vertices else []
+        self.soma_estimativa = 0.0
+        self._pendentes = deque(range(numero_vertices))
+        self._na_fila = bytearray(b"\x01" * numero_vertices)
+        self._push()
+
+    def _transicoes(self, u):
+        sucessores = list(self.graph.getWeightedSuccessors(u))
+        if not self.weighted:
+            return [(v, 1.0) for v, _ in sucessores], float(len(sucessores))
+        return sucessores, sum(peso for _, peso in sucessores)
+
+    def _enfileirar(self, v):
+        if not self._na_fila[v] and abs(self.residuo[v]) > self._limiar:
+            self._na_fila[v] = 1
+            self._pendentes.append(v)
+
+    def _espalhar(self, u, massa):
+        sucessores, total = self._transicoes(u)
+        if total == 0:
+            return
+        fator = self.alpha * massa / total
+        residuo = self.residuo
+        for v, peso in sucessores:
+            residuo[v] += fator * peso
+            self._enfileirar(v)
+
+    def _push(self):
+        residuo = self.residuo
+        while self._pendentes:
+            u = self._pendentes.popleft()
+            self._na_fila[u] = 0
+            massa = residuo[u]
+            if abs(massa) <= self._limiar:
+                continue
+            residuo[u] = 0.0
+            self.estimativa[u] += massa
+            self.soma_estimativa += massa
+            self._espalhar(u, massa)
+
+    def _clustering(self, v):
+        grau = len(self.vizinhos[v])
+        if grau < 2:
+            return 0.0
+        return 2 * self.triangulos[v] / (grau * (grau - 1))
+
+    def _link_undirected(self, u, v, delta):
+        vizinhos = self.vizinhos
+        comuns = vizinhos[u] & vizinhos[v]
+        afetados = comuns | {u, v}
+        self.soma_clustering -= sum(self._clustering(w) for w in afetados)
+        self.total_triplas -= sum(len(vizinhos[w]) * (len(vizinhos[w]) - 1) // 2 for w in (u, v))
+        if delta > 0:
+            vizinhos[u].add(v)
+            vizinhos[v].add(u)
+        else:
+            vizinhos[u].discard(v)
+            vizinhos[v].discard(u)
+        self.triangulos[u] += delta * len(comuns)
+        self.triangulos[v] += delta * len(comuns)
+        for w in comuns:
+            self.triangulos[w] += delta
+        self.total_triangulos += delta * len(comuns)
+        self.total_triplas += sum(len(vizinhos[w]) * (len(vizinhos[w]) - 1) // 2 for w in (u, v))
+        self.soma_clustering += sum(self._clustering(w) for w in afetados)
+
+    def _apply(self, origens, alterar):
+        origens = set(origens)
+        for u in origens:
+            self._espalhar(u, -self.estimativa[u])
+        alterar()
+        for u in origens:
+            self._espalhar(u, self.estimativa[u])
+        self._push()
+
+    def _validated_weights(self, weights, quantidade):
+        if weights is None:
+            return [1.0] * quantidade
+        pesos = []
+        for peso in weights:
+            if isinstance(peso, bool) or not isinstance(peso, (int, float)) or not math.isfinite(peso) or peso < 0:
+                raise ValueError("Peso de aresta deve ser um número finito não negativo")
+            pesos.append(float(peso))
+        return pesos
+
+    def _validate_existing_edges(self, us, vs):
+        graph = self.graph
+        for u, v in zip(us, vs):
+            if not graph.hasEdge(u, v):
+                raise ValueError("Aresta inexistente")
+
+    def add_edges(self, us, vs, weights=None, combine="sum"):
+        graph = self.graph
+        graph._validate_edge_batch(us, vs, weights, combine)
+        pesos = self._validated_weights(weights, len(us))
+
+        def alterar():
+            for u, v, peso in zip(us, vs, pesos):
+                if graph.hasEdge(u, v):
+                    graph.addEdges([u], [v], [peso], combine)
+                    continue
+                reciproca = graph.hasEdge(v, u)
+                graph.addEdge(u, v)
+                graph.setEdgeWeight(u, v, peso)
+                self.graus_saida[u] += 1
+                self.graus_entrada[v] += 1
+                if not reciproca:
+                    self._link_undirected(u, v, 1)
+
+        self._apply(us, alterar)
+
+    def set_edge_weights(self, us, vs, weights):
+        graph = self.graph
+        if weights is None:
+            raise ValueError("Informe os pesos das arestas")
+        graph._validate_edge_batch(us, vs, weights, "replace")
+        self._validate_existing_edges(us, vs)
+        pesos = self._validated_weights(weights, len(us))
+
+        def alterar():
+            for u, v, peso in zip(us, vs, pesos):
+                graph.setEdgeWeight(u, v, peso)
+
+        self._apply(us, alterar)
+
+    def remove_edges(self, us, vs):
+        graph = self.graph
+        graph._validate_edge_batch(us, vs, None, "sum")
+        self._validate_existing_edges(us, vs)
+        if len(set(zip(us, vs))) != len(us):
+            raise ValueError("Aresta repetida no lote de remoção")
+
+        def alterar():
+            for u, v in zip(us, vs):
+                graph.removeEdge(u, v)
+                self.graus_saida[u] -= 1
+                self.graus_entrada[v] -= 1
+                if not graph.hasEdge(v, u):
+                    self._link_undirected(u, v, -1)
+
+        self._apply(us, alterar)
+
+    def apply_events(self, eventos, indice_por_usuario, weights_by_type=INTEGRATED_WEIGHTS):
+        us, vs, ws = collect_edge_arrays(eventos, indice_por_usuario, weights_by_type)
+        self.add_edges(us, vs, ws, "sum")
+
+    def degrees(self):
+        graus_entrada = dict(enumerate(self.graus_entrada))
+        graus_saida = dict(enumerate(self.graus_saida))
+        graus_total = {v: graus_entrada[v] + graus_saida[v] for v in graus_entrada}
+        return graus_entrada, graus_saida, graus_total
+
+    def density(self):
+        return density(self.graph)
+
+    def pagerank(self):
+        if self.soma_estimativa == 0:
+            return {}
+        return {v: valor / self.soma_estimativa for v, valor in enumerate(self.estimativa)}
+
+    def vertex_triangles(self):
+        return dict(enumerate(self.triangulos))
+
+    def clustering_coefficients(self):
+        return {v: self._clustering(v) for v in range(len(self.vizinhos))}
+
+    def average_clustering(self):
+        numero_vertices = len(self.vizinhos)
+        return self.soma_clustering / numero_vertices if numero_vertices else 0.0
+
+    def transitivity(self):
+        if self.total_triplas == 0:
+            return 0.0
+        return 3 * self.total_triangulos / self.total_triplas
+
+
 def top_n_pretty(titulo, metrica, usuarios, quantidade=10):
     print(f"\n===== {titulo} (Top {quantidade}) =====")
     print(f"{'Rank':<5} {'Usuário':<30} {'ID':<6} {'Valor':<12}")
     print("-" * 60)
-    itens_ordenados = sorted(metrica.items(), key=lambda item: item[1], reverse=True)[:quantidade]
+    itens_ordenados = heapq.nlargest(quantidade, metrica.items(), key=lambda item: item[1])
     for posicao, (id_vertice, valor) in enumerate(itens_ordenados, start=1):
         nome_usuario = usuarios[id_vertice]
         print(f"{posicao:<5} {nome_usuario:<30} {id_vertice:<6} {valor:<12.6f}")
 
 
-def export_top_n_csv(caminho_arquivo, dados_metrica, lista_usuarios, quantidade=10):
-    itens_ordenados = sorted(dados_metrica.items(), key=lambda item: item[1], reverse=True)[:quantidade]
-    
-    with open(caminho_arquivo, "w", newline="", encoding="utf-8") as arquivo_saida:
-        escritor_csv = csv.writer(arquivo_saida, delimiter=";")
-        
-        escritor_csv.writerow(["rank", "vertex_id", "username", "value"])
-        
-        for posicao, (id_vertice, valor) in enumerate(itens_ordenados, start=1):
-            escritor_csv.writerow([posicao, id_vertice, lista_usuarios[id_vertice], valor])
+class MetricsTable:
+    def __init__(self, numero_vertices, usuarios=None):
+        if usuarios is not None and len(usuarios) != numero_vertices:
+            raise ValueError("Lista de usuários deve ter uma posição por vértice")
+        self.numero_vertices = numero_vertices
+        self.usuarios = list(range(numero_vertices)) if usuarios is None else list(usuarios)
+        self.colunas = {}
+
+    def add_column(self, nome, valores):
+        if isinstance(valores, dict):
+            valores = [valores.get(vertice, 0) for vertice in range(self.numero_vertices)]
+        if len(valores) != self.numero_vertices:
+            raise ValueError("Coluna deve ter uma posição por vértice")
+        inteiros = all(isinstance(valor, int) for valor in valores)
+        self.colunas[nome] = array("q" if inteiros else "d", valores)
+        return self.colunas[nome]
+
+    def column(self, nome):
+        coluna = self.colunas.get(nome)
+        if coluna is None:
+            raise KeyError(f"Coluna inexistente: {nome}")
+        return coluna
+
+    def top_k(self, nome, quantidade=10):
+        coluna = self.column(nome)
+        indices = heapq.nlargest(quantidade, range(self.numero_vertices), key=coluna.__getitem__)
+        return [(vertice, coluna[vertice]) for vertice in indices]
+
+    def rank_column(self, nome):
+        coluna = self.column(nome)
+        ordem = sorted(range(self.numero_vertices), key=coluna.__getitem__, reverse=True)
+        posicoes = array("q", bytes(8 * self.numero_vertices))
+        for indice, vertice in enumerate(ordem):
+            if indice > 0 and coluna[vertice] == coluna[ordem[indice - 1]]:
+                posicoes[vertice] = posicoes[ordem[indice - 1]]
+            else:
+                posicoes[vertice] = indice + 1
+        return posicoes
 
+    def percentile_column(self, nome):
+        coluna = self.column(nome)
+        ordenados = sorted(coluna)
+        escala = 100.0 / self.numero_vertices if self.numero_vertices else 0.0
+        return array("d", (bisect_right(ordenados, valor) * escala for valor in coluna))
 
-def run_analysis():
+    def add_rank_columns(self, nomes):
+        for nome in nomes:
+            self.colunas[f"{nome}_rank"] = self.rank_column(nome)
+            self.colunas[f"{nome}_percentile"] = self.percentile_column(nome)
+
+    def write_summary(self, caminho_arquivo, nomes=None):
+        nomes = list(self.colunas) if nomes is None else list(nomes)
+        colunas = [self.column(nome) for nome in nomes]
+        with open(caminho_arquivo, "w", newline="", encoding="utf-8", buffering=1 << 20) as arquivo_saida:
+            escritor_csv = csv.writer(arquivo_saida, delimiter=";", lineterminator="\n")
+            escritor_csv.writerow(["vertex", "user"] + nomes)
+            valores_por_vertice = zip(*colunas) if colunas else [()] * self.numero_vertices
+            escritor_csv.writerows(
+                (vertice, usuario, *valores)
+                for vertice, usuario, valores in zip(range(self.numero_vertices), self.usuarios, valores_por_vertice)
+            )
+
+    def write_top_k(self, diretorio, nomes, quantidade=10, prefixo="top10_"):
+        caminhos = []
+        for nome in nomes:
+            caminho_arquivo = os.path.join(diretorio, f"{prefixo}{nome}.csv")
+            with open(caminho_arquivo, "w", newline="", encoding="utf-8") as arquivo_saida:
+                escritor_csv = csv.writer(arquivo_saida, delimiter=";")
+                escritor_csv.writerow(["rank", "vertex_id", "username", "value"])
+                for posicao, (vertice, valor) in enumerate(self.top_k(nome, quantidade), start=1):
+                    escritor_csv.writerow([posicao, vertice, self.usuarios[vertice], valor])
+            caminhos.append(caminho_arquivo)
+        return caminhos
+
+    def write_npz(self, caminho_arquivo):
+        try:
+            import numpy
+        except ImportError as erro:
+            raise RuntimeError("Exportação .npz requer NumPy instalado") from erro
+        colunas = {
+            nome: numpy.frombuffer(coluna, dtype=numpy.int64 if coluna.typecode == "q" else numpy.float64)
+            for nome, coluna in self.colunas.items()
+        }
+        numpy.savez_compressed(
+            caminho_arquivo,
+            vertex=numpy.arange(self.numero_vertices, dtype=numpy.int64),
+            user=numpy.array([str(usuario) for usuario in self.usuarios]),
+            **colunas,
+        )
+
+
+def load_integrated_graph():
     caminhos_arquivos = ensure_data_files()
+    caminho_snapshot = os.path.join(DATA_DIR, SNAPSHOT_FILE)
+
+    if os.path.isfile(caminho_snapshot):
+        modificacao_dados = max(os.path.getmtime(caminho) for caminho in caminhos_arquivos.values())
+        if os.path.getmtime(caminho_snapshot) >= modificacao_dados:
+            grafo_integrado = CSRGraph.load(caminho_snapshot)
+            lista_usuarios = [grafo_integrado.getVertexLabel(v) for v in range(grafo_integrado.getVertexCount())]
+            print("Snapshot binário carregado de:", caminho_snapshot)
+            return grafo_integrado, lista_usuarios
+
     dados_issues, dados_prs, dados_eventos = load_jsons(caminhos_arquivos)
-    
-    lista_usuarios, mapa_usuario_indice = collect_users(dados_issues, dados_prs, dados_eventos)
+    grafo_integrado = build_labeled_graph(dados_eventos, graph=collect_users(dados_issues, dados_prs, dados_eventos))
+    lista_usuarios = grafo_integrado.getLabels()
+    grafo_integrado.save(caminho_snapshot, labels=lista_usuarios)
+    print("Snapshot binário salvo em:", caminho_snapshot)
+    return grafo_integrado, lista_usuarios
+
+
+def run_analysis(weighted=None):
+    diretorio_analise = os.path.join(os.getcwd(), "analysis")
+    METRIC_CACHE.setDirectory(os.path.join(diretorio_analise, METRIC_CACHE_DIR))
+    grafo_integrado, lista_usuarios = load_integrated_graph()
     numero_total_vertices = len(lista_usuarios)
-    
-    grafo_integrado = build_integrated_graph(dados_eventos, mapa_usuario_indice, numero_total_vertices)
 
-    graus_entrada, graus_saida, graus_total = compute_degrees(grafo_integrado)
-    centralidade_closeness = closeness_centrality(grafo_integrado)
-    centralidade_betweenness = betweenness_centrality(grafo_integrado)
-    resultado_pagerank = pagerank(grafo_integrado)
-    coeficientes_agrupamento = clustering_coefficients(grafo_integrado)
-    densidade_rede = density(grafo_integrado)
-    assortatividade = assortativity_degree(grafo_integrado)
-    comunidades_detectadas = communities_connected_components(grafo_integrado)
+    if weighted is None:
+        weighted = has_non_unit_weights(grafo_integrado)
+    metricas_ponderadas = ["weighted_betweenness", "weighted_closeness"] if weighted else []
+    pedidas = [nome for nome in METRIC_PIPELINE if weighted or not nome.startswith("weighted_")]
+    metricas = run_metric_pipeline(grafo_integrado, pedidas, workers=os.cpu_count())
+    graus_entrada, graus_saida, graus_total = metricas["degrees"]
+    centralidade_closeness = metricas["closeness"]
+    centralidade_betweenness = metricas["betweenness"]
+    resultado_pagerank = metricas["pagerank"]
+    coeficientes_agrupamento = metricas["clustering"]
+    transitividade = metricas["transitivity"]
+    densidade_rede = metricas["density"]
+    assortatividade = metricas["assortativity"]
+    comunidades_detectadas = metricas["components"]
+    componentes_fortes = metricas["strong_components"]
+    tamanhos_componentes_fortes = community_sizes(_group_communities(componentes_fortes[0]))
+    comunidades_louvain, modularidade, tamanhos_comunidades = metricas["communities"]
+    _, estatisticas_distancia = metricas["distances"]
+    comprimento_medio, erro_comprimento = metricas["average_path_length"]
 
     agrupamento_medio = sum(coeficientes_agrupamento.values()) / numero_total_vertices if numero_total_vertices > 0 else 0.0
 
@@ -294,41 +1722,62 @@ def run_analysis():
     print("Densidade da rede:", densidade_rede)
     print("Assortatividade (grau):", assortatividade)
     print("Número de comunidades (componentes):", len(comunidades_detectadas))
+    print("Componentes fortemente conexas:", componentes_fortes[1])
+    print("Maior componente fortemente conexa:", tamanhos_componentes_fortes[0] if tamanhos_componentes_fortes else 0)
+    print("Número de comunidades (Louvain):", len(comunidades_louvain))
+    print("Modularidade (Louvain):", modularidade)
+    print("Maiores comunidades (Louvain):", tamanhos_comunidades[:10])
     print("Clustering médio:", agrupamento_medio)
+    print("Transitividade:", transitividade)
+    if estatisticas_distancia:
+        maior_componente = estatisticas_distancia[0]
+        print("Diâmetro (maior componente):", maior_componente["diameter"])
+        print("Raio (maior componente):", maior_componente["radius"])
+        print("Vértices na periferia:", len(maior_componente["periphery"]))
+        print("BFS executadas para excentricidades:", sum(componente["bfs_runs"] for componente in estatisticas_distancia))
+    print(f"Comprimento médio de caminho (estimado): {comprimento_medio:.4f} ± {erro_comprimento:.4f}")
 
-    top_n_pretty("Grau total", graus_total, lista_usuarios)
-    top_n_pretty("Betweenness", centralidade_betweenness, lista_usuarios)
-    top_n_pretty("Closeness", centralidade_closeness, lista_usuarios)
-    top_n_pretty("PageRank", resultado_pagerank, lista_usuarios)
-    top_n_pretty("Clustering Coefficient", coeficientes_agrupamento, lista_usuarios)
+    tabela = MetricsTable(numero_total_vertices, lista_usuarios)
+    tabela.add_column("in_degree", graus_entrada)
+    tabela.add_column("out_degree", graus_saida)
+    tabela.add_column("degree", graus_total)
+    tabela.add_column("closeness", centralidade_closeness)
+    tabela.add_column("betweenness", centralidade_betweenness)
+    if weighted:
+        tabela.add_column("weighted_closeness", metricas["weighted_closeness"])
+        tabela.add_column("weighted_betweenness", metricas["weighted_betweenness"])
+    tabela.add_column("pagerank", resultado_pagerank)
+    tabela.add_column("clustering", coeficientes_agrupamento)
+    tabela.add_rank_columns(["degree", "betweenness", "closeness", "pagerank"])
+
+    for titulo, coluna in (
+        ("Grau total", "degree"),
+        ("Betweenness", "betweenness"),
+        ("Closeness", "closeness"),
+        ("Betweenness ponderado", "weighted_betweenness"),
+        ("Closeness ponderado", "weighted_closeness"),
+        ("PageRank", "pagerank"),
+        ("Clustering Coefficient", "clustering"),
+    ):
+        if coluna not in tabela.colunas:
+            continue
+        top_n_pretty(titulo, dict(tabela.top_k(coluna)), lista_usuarios)
 
-    diretorio_analise = os.path.join(os.getcwd(), "analysis")
     if not os.path.isdir(diretorio_analise):
         os.makedirs(diretorio_analise, exist_ok=True)
 
-    export_top_n_csv(os.path.join(diretorio_analise, "top10_degree.csv"), graus_total, lista_usuarios)
-    export_top_n_csv(os.path.join(diretorio_analise, "top10_betweenness.csv"), centralidade_betweenness, lista_usuarios)
-    export_top_n_csv(os.path.join(diretorio_analise, "top10_closeness.csv"), centralidade_closeness, lista_usuarios)
-    export_top_n_csv(os.path.join(diretorio_analise, "top10_pagerank.csv"), resultado_pagerank, lista_usuarios)
-    export_top_n_csv(os.path.join(diretorio_analise, "top10_clustering.csv"), coeficientes_agrupamento, lista_usuarios)
+    tabela.write_top_k(diretorio_analise, ["degree", "betweenness", "closeness", *metricas_ponderadas, "pagerank", "clustering"])
+
+    pertinencia = community_membership(comunidades_louvain, numero_total_vertices)
+    caminho_comunidades = os.path.join(diretorio_analise, "graph_integrated_communities")
+    for formato in EXPORT_FORMATS:
+        grafo_integrado.export(caminho_comunidades, formato, labels=lista_usuarios, nodeAttributes={"community": pertinencia})
 
     caminho_resumo = os.path.join(diretorio_analise, "centrality_summary.csv")
-    with open(caminho_resumo, "w", encoding="utf-8") as arquivo_resumo:
-        arquivo_resumo.write("vertex;user;in_degree;out_degree;degree;closeness;betweenness;pagerank;clustering\n")
-        
-        for id_vertice in range(numero_total_vertices):
-            nome_usuario = lista_usuarios[id_vertice]
-            
-            linha = (
-                f"{id_vertice};{nome_usuario};"
-                f"{graus_entrada[id_vertice]};{graus_saida[id_vertice]};{graus_total[id_vertice]};"
-                f"{centralidade_closeness.get(id_vertice, 0.0)};"
-                f"{centralidade_betweenness.get(id_vertice, 0.0)};"
-                f"{resultado_pagerank.get(id_vertice, 0.0)};"
-                f"{coeficientes_agrupamento.get(id_vertice, 0.0)}\n"
-            )
-            arquivo_resumo.write(linha)
-            
+    tabela.write_summary(caminho_resumo)
+    if importlib.util.find_spec("numpy") is not None:
+        tabela.write_npz(os.path.join(diretorio_analise, "centrality_summary.npz"))
+
     print("\nResumo de centralidades salvo em:", caminho_resumo)
 
 
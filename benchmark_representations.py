@@ -0,0 +1,91 @@
+import random
+import time
+import tracemalloc
+
+from grafh_blibiotecas.adjacency_list_graph import AdjacencyListGraph
+from grafh_blibiotecas.adjacency_matrix_graph import AdjacencyMatrixGraph
+from grafh_blibiotecas.compact_adjacency_matrix_graph import CompactAdjacencyMatrixGraph
+from grafh_blibiotecas.graph_factory import chooseRepresentation
+
+REPRESENTATIONS = (AdjacencyListGraph, AdjacencyMatrixGraph, CompactAdjacencyMatrixGraph)
+VERTEX_COUNTS = (200, 800)
+DENSITIES = (0.01, 0.05, 0.1, 0.25, 0.5)
+QUERIES = 200000
+
+
+def random_edges(numero_vertices, densidade, semente=42):
+    gerador = random.Random(semente)
+    quantidade = int(densidade * numero_vertices * (numero_vertices - 1))
+    arestas = set()
+    while len(arestas) < quantidade:
+        u = gerador.randrange(numero_vertices)
+        v = gerador.randrange(numero_vertices)
+        if u != v:
+            arestas.add((u, v))
+    us = [u for u, _ in arestas]
+    vs = [v for _, v in arestas]
+    pesos = [float(gerador.randint(1, 5)) for _ in arestas]
+    return us, vs, pesos
+
+
+def measure(classe, numero_vertices, us, vs, pesos, consultas):
+    tracemalloc.start()
+    grafo = classe.fromEdgeArrays(numero_vertices, us, vs, pesos)
+    _, pico_memoria = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del grafo
+
+    inicio = time.perf_counter()
+    grafo = classe.fromEdgeArrays(numero_vertices, us, vs, pesos)
+    tempo_construcao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for u, v in consultas:
+        grafo.hasEdge(u, v)
+    tempo_consultas = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for u in range(numero_vertices):
+        for _ in grafo.getSuccessors(u):
+            pass
+    tempo_varredura = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for u in range(numero_vertices):
+        grafo.getVertexInDegree(u)
+    tempo_grau = time.perf_counter() - inicio
+
+    return tempo_construcao, tempo_consultas, tempo_varredura, tempo_grau, pico_memoria
+
+
+def run_benchmark():
+    gerador = random.Random(7)
+    print(f"{'n':>6} {'dens':>6} {'representação':<30} {'build(s)':>9} {'hasEdge(s)':>11} "
+          f"{'scan(s)':>9} {'indeg(s)':>9} {'mem(MB)':>9}")
+    for numero_vertices in VERTEX_COUNTS:
+        consultas = [
+            (u, v)
+            for u, v in ((gerador.randrange(numero_vertices), gerador.randrange(numero_vertices)) for _ in range(QUERIES))
+            if u != v
+        ]
+        for densidade in DENSITIES:
+            us, vs, pesos = random_edges(numero_vertices, densidade)
+            melhor = None
+            menor_memoria = None
+            for classe in REPRESENTATIONS:
+                resultado = measure(classe, numero_vertices, us, vs, pesos, consultas)
+                total = sum(resultado[:4])
+                if melhor is None or total < melhor[1]:
+                    melhor = (classe.__name__, total)
+                if menor_memoria is None or resultado[4] < menor_memoria[1]:
+                    menor_memoria = (classe.__name__, resultado[4])
+                print(f"{numero_vertices:>6} {densidade:>6.2f} {classe.__name__:<30} "
+                      f"{resultado[0]:>9.3f} {resultado[1]:>11.3f} {resultado[2]:>9.3f} {resultado[3]:>9.3f} "
+                      f"{resultado[4] / 1e6:>9.1f}")
+            escolhida = chooseRepresentation(numero_vertices, density=densidade).__name__
+            print(f"{'':>6} {'':>6} mais rápida: {melhor[0]}; menor memória: {menor_memoria[0]}; "
+                  f"fábrica escolhe: {escolhida}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,4 +1,14 @@
+import copy
+import operator
 from abc import ABC, abstractmethod
+from array import array
+from itertools import repeat
+from typing import Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+from grafh_blibiotecas.disjoint_set import DisjointSet
+from grafh_blibiotecas.graph_export import EXPORTERS
+from grafh_blibiotecas.snapshot_format import writeSnapshot
+
+EDGE_COMBINE_MODES = ("sum", "max", "replace")
 
 
 class AbstractGraph(ABC):
@@ -10,6 +20,9 @@ class AbstractGraph(ABC):
         self._num_vertices = numVertices
         self._vertex_weights = [0.0 for _ in range(numVertices)]
         self._edge_count = 0
+        self._components: Optional[DisjointSet] = None
+        self._components_stale = False
+        self._version = 0
 
     def _validate_vertex_index(self, v: int):
         if not isinstance(v, int):
@@ -23,6 +36,86 @@ class AbstractGraph(ABC):
         if u == v:
             raise ValueError("Grafo simples não permite laços")
 
+    def _validate_edge_batch(
+        self, us: Sequence[int], vs: Sequence[int], weights: Optional[Sequence[float]], combine: str
+    ) -> Optional[array]:
+        if combine not in EDGE_COMBINE_MODES:
+            raise ValueError("Modo de combinação inválido")
+        if len(us) != len(vs) or (weights is not None and len(weights) != len(us)):
+            raise ValueError("Vetores de arestas devem ter o mesmo tamanho")
+        weight_values = None
+        if weights is not None:
+            try:
+                weight_values = array("d", map(float, weights))
+            except (TypeError, ValueError) as error:
+                raise ValueError("Peso de aresta deve ser numérico") from error
+        if len(us) == 0:
+            return weight_values
+        for values in (us, vs):
+            is_int_array = isinstance(values, array) and values.typecode in "bBhHiIlLqQ"
+            if not is_int_array and not all(isinstance(x, int) for x in values):
+                raise TypeError("Índice de vértice deve ser inteiro")
+            if min(values) < 0 or max(values) >= self._num_vertices:
+                raise IndexError("Índice de vértice fora dos limites")
+        if any(map(operator.eq, us, vs)):
+            raise ValueError("Grafo simples não permite laços")
+        return weight_values
+
+    def _add_edges_unchecked(self, us: Sequence[int], vs: Sequence[int], weights: Iterable[float], combine: str) -> None:
+        for u, v, w in zip(us, vs, weights):
+            if not self.hasEdge(u, v):
+                self.addEdge(u, v)
+                self.setEdgeWeight(u, v, w)
+            elif combine == "sum":
+                self.setEdgeWeight(u, v, self.getEdgeWeight(u, v) + w)
+            elif combine == "max":
+                if w > self.getEdgeWeight(u, v):
+                    self.setEdgeWeight(u, v, w)
+            else:
+                self.setEdgeWeight(u, v, w)
+
+    def addEdges(
+        self,
+        us: Sequence[int],
+        vs: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+        combine: str = "sum",
+    ) -> None:
+        values = self._validate_edge_batch(us, vs, weights, combine)
+        self._add_edges_unchecked(us, vs, repeat(1.0) if values is None else values, combine)
+
+    @classmethod
+    def fromEdgeArrays(
+        cls,
+        numVertices: int,
+        us: Sequence[int],
+        vs: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+        combine: str = "sum",
+    ):
+        graph = cls(numVertices)
+        graph.addEdges(us, vs, weights, combine)
+        return graph
+
+    def _own_row(self, rows: list, owned: Optional[bytearray], i: int):
+        row = rows[i]
+        if owned is not None and not owned[i]:
+            row = row.copy()
+            rows[i] = row
+            owned[i] = 1
+        return row
+
+    def _share_storage_with(self, clone: "AbstractGraph") -> None:
+        raise TypeError("Representação não suporta snapshots")
+
+    def snapshot(self) -> "AbstractGraph":
+        clone = copy.copy(self)
+        clone._vertex_weights = list(self._vertex_weights)
+        clone._components = None
+        clone._components_stale = False
+        self._share_storage_with(clone)
+        return clone
+
     def _increment_edge_count(self):
         self._edge_count += 1
 
@@ -31,6 +124,62 @@ class AbstractGraph(ABC):
             raise ValueError("Não há arestas para remover")
         self._edge_count -= 1
 
+    def _mark_modified(self) -> None:
+        self._version += 1
+
+    def getVersion(self) -> int:
+        return self._version
+
+    def _on_edge_added(self, u: int, v: int) -> None:
+        self._mark_modified()
+        if self._components is not None and not self._components_stale:
+            self._components.union(u, v)
+
+    def _on_edge_removed(self, u: int, v: int) -> None:
+        self._mark_modified()
+        if self._components is not None:
+            self._components_stale = True
+
+    def _build_components(self) -> DisjointSet:
+        components = DisjointSet(self._num_vertices)
+        for u in range(self._num_vertices):
+            for v in self.getSuccessors(u):
+                components.union(u, v)
+        return components
+
+    def _current_components(self) -> DisjointSet:
+        if self._components is None:
+            return self._build_components()
+        if self._components_stale:
+            self._components = self._build_components()
+            self._components_stale = False
+        return self._components
+
+    def enableConnectivityTracking(self) -> None:
+        self._components = self._build_components()
+        self._components_stale = False
+
+    def disableConnectivityTracking(self) -> None:
+        self._components = None
+        self._components_stale = False
+
+    def isConnectivityTracked(self) -> bool:
+        return self._components is not None
+
+    def getComponentCount(self) -> int:
+        return self._current_components().componentCount()
+
+    def getComponentId(self, v: int) -> int:
+        self._validate_vertex_index(v)
+        return self._current_components().find(v)
+
+    def getComponentSize(self, v: int) -> int:
+        self._validate_vertex_index(v)
+        return self._current_components().componentSize(v)
+
+    def getComponents(self) -> List[List[int]]:
+        return self._current_components().groups()
+
     def getVertexCount(self) -> int:
         return self._num_vertices
 
@@ -78,6 +227,20 @@ class AbstractGraph(ABC):
             return False
         return x == u or x == v
 
+    @abstractmethod
+    def getSuccessors(self, u: int) -> Iterable[int]:
+        ...
+
+    @abstractmethod
+    def getPredecessors(self, u: int) -> Iterable[int]:
+        ...
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        return [(v, self.getEdgeWeight(u, v)) for v in self.getSuccessors(u)]
+
+    def getWeightedPredecessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        return [(v, self.getEdgeWeight(v, u)) for v in self.getPredecessors(u)]
+
     @abstractmethod
     def getVertexInDegree(self, u: int) -> int:
         ...
@@ -89,11 +252,27 @@ class AbstractGraph(ABC):
     def setVertexWeight(self, v: int, w: float) -> None:
         self._validate_vertex_index(v)
         self._vertex_weights[v] = float(w)
+        self._mark_modified()
 
     def getVertexWeight(self, v: int) -> float:
         self._validate_vertex_index(v)
         return self._vertex_weights[v]
 
+    def getEdgeArrays(self) -> Tuple[array, array, array]:
+        us = array("q")
+        vs = array("q")
+        ws = array("d")
+        for u in range(self._num_vertices):
+            for v, w in self.getWeightedSuccessors(u):
+                us.append(u)
+                vs.append(v)
+                ws.append(w)
+        return us, vs, ws
+
+    def getVertexLabel(self, v: int) -> Optional[Hashable]:
+        self._validate_vertex_index(v)
+        return None
+
     @abstractmethod
     def setEdgeWeight(self, u: int, v: int, w: float) -> None:
         ...
@@ -107,13 +286,48 @@ class AbstractGraph(ABC):
         ...
 
     def isEmptyGraph(self) -> bool:
-        return self._edge_count == 0
+        return self.getEdgeCount() == 0
 
     def isCompleteGraph(self) -> bool:
         n = self._num_vertices
         expected_edges = n * (n - 1)
-        return self._edge_count == expected_edges
+        return self.getEdgeCount() == expected_edges
+
+    def export(
+        self,
+        path: str,
+        format: str = "csv",
+        compress: bool = False,
+        labels: Optional[Sequence[Hashable]] = None,
+        nodeAttributes: Optional[Mapping[str, Sequence]] = None,
+    ) -> List[str]:
+        if not path:
+            raise ValueError("Caminho inválido")
+        exporter = EXPORTERS.get(format)
+        if exporter is None:
+            raise ValueError("Formato de exportação inválido")
+        return exporter(self, path, compress, labels, nodeAttributes)
 
-    @abstractmethod
     def exportToGEPHI(self, path: str) -> None:
-        ...
+        self.export(path, "csv")
+
+    def save(self, path: str, labels: Optional[Sequence[str]] = None) -> None:
+        if not path:
+            raise ValueError("Caminho inválido")
+        n = self._num_vertices
+        if labels is None:
+            stored = [self.getVertexLabel(i) for i in range(n)]
+            if any(label is not None for label in stored):
+                labels = [i if label is None else label for i, label in enumerate(stored)]
+        elif len(labels) != n:
+            raise ValueError("Rótulos devem ter numVertices posições")
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for u in range(n):
+            for v, w in sorted(self.getWeightedSuccessors(u)):
+                targets.append(v)
+                weights.append(w)
+            offsets.append(len(targets))
+        vertex_weights = array("d", (self.getVertexWeight(i) for i in range(n)))
+        writeSnapshot(path, n, offsets, targets, weights, vertex_weights, labels)
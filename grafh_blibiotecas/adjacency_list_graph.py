@@ -1,11 +1,24 @@
-from typing import Dict, List
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from grafh_blibiotecas.abstract_graph import AbstractGraph
+from grafh_blibiotecas.csr_graph import CSRGraph
 
 
 class AdjacencyListGraph(AbstractGraph):
     def __init__(self, numVertices: int):
         super().__init__(numVertices)
         self._adjacency: List[Dict[int, float]] = [{} for _ in range(numVertices)]
+        self._reverse_adjacency: List[Set[int]] = [set() for _ in range(numVertices)]
+        self._adjacency_owned: Optional[bytearray] = None
+        self._reverse_owned: Optional[bytearray] = None
+
+    def _share_storage_with(self, clone: "AdjacencyListGraph") -> None:
+        clone._adjacency = list(self._adjacency)
+        clone._reverse_adjacency = list(self._reverse_adjacency)
+        self._adjacency_owned = bytearray(self._num_vertices)
+        self._reverse_owned = bytearray(self._num_vertices)
+        clone._adjacency_owned = bytearray(self._num_vertices)
+        clone._reverse_owned = bytearray(self._num_vertices)
 
     def hasEdge(self, u: int, v: int) -> bool:
         self._validate_edge_indices(u, v)
@@ -14,23 +27,69 @@ class AdjacencyListGraph(AbstractGraph):
     def addEdge(self, u: int, v: int) -> None:
         self._validate_edge_indices(u, v)
         if not self.hasEdge(u, v):
-            self._adjacency[u][v] = 1.0
+            self._own_row(self._adjacency, self._adjacency_owned, u)[v] = 1.0
+            self._own_row(self._reverse_adjacency, self._reverse_owned, v).add(u)
             self._increment_edge_count()
+            self._on_edge_added(u, v)
 
     def removeEdge(self, u: int, v: int) -> None:
         self._validate_edge_indices(u, v)
         if not self.hasEdge(u, v):
             raise ValueError("Aresta inexistente")
-        del self._adjacency[u][v]
+        del self._own_row(self._adjacency, self._adjacency_owned, u)[v]
+        self._own_row(self._reverse_adjacency, self._reverse_owned, v).discard(u)
         self._decrement_edge_count()
+        self._on_edge_removed(u, v)
+
+    def _add_edges_unchecked(self, us, vs, weights, combine) -> None:
+        adjacency = self._adjacency
+        reverse_adj = self._reverse_adjacency
+        adjacency_owned = self._adjacency_owned
+        reverse_owned = self._reverse_owned
+        components = None if self._components_stale else self._components
+        added = 0
+        for u, v, w in zip(us, vs, weights):
+            if adjacency_owned is None:
+                row = adjacency[u]
+            else:
+                row = self._own_row(adjacency, adjacency_owned, u)
+            current = row.get(v)
+            if current is None:
+                row[v] = w
+                if reverse_owned is None:
+                    reverse_adj[v].add(u)
+                else:
+                    self._own_row(reverse_adj, reverse_owned, v).add(u)
+                added += 1
+                if components is not None:
+                    components.union(u, v)
+            elif combine == "sum":
+                row[v] = current + w
+            elif combine == "replace" or w > current:
+                row[v] = w
+        self._edge_count += added
+        self._mark_modified()
+
+    def getSuccessors(self, u: int) -> Iterable[int]:
+        self._validate_vertex_index(u)
+        return self._adjacency[u].keys()
+
+    def getPredecessors(self, u: int) -> Iterable[int]:
+        self._validate_vertex_index(u)
+        return frozenset(self._reverse_adjacency[u])
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        return self._adjacency[u].items()
+
+    def getWeightedPredecessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        adjacency = self._adjacency
+        return [(v, adjacency[v][u]) for v in self._reverse_adjacency[u]]
 
     def getVertexInDegree(self, u: int) -> int:
         self._validate_vertex_index(u)
-        count = 0
-        for i in range(self._num_vertices):
-            if u in self._adjacency[i]:
-                count += 1
-        return count
+        return len(self._reverse_adjacency[u])
 
     def getVertexOutDegree(self, u: int) -> int:
         self._validate_vertex_index(u)
@@ -40,7 +99,8 @@ class AdjacencyListGraph(AbstractGraph):
         self._validate_edge_indices(u, v)
         if not self.hasEdge(u, v):
             raise ValueError("Não é possível definir peso de aresta inexistente")
-        self._adjacency[u][v] = float(w)
+        self._own_row(self._adjacency, self._adjacency_owned, u)[v] = float(w)
+        self._mark_modified()
 
     def getEdgeWeight(self, u: int, v: int) -> float:
         self._validate_edge_indices(u, v)
@@ -52,10 +112,9 @@ class AdjacencyListGraph(AbstractGraph):
         n = self._num_vertices
         if n == 0:
             return False
-        reverse_adj: List[List[int]] = [[] for _ in range(n)]
-        for u in range(n):
-            for v in self._adjacency[u].keys():
-                reverse_adj[v].append(u)
+        if self._components is not None:
+            return self.getComponentCount() == 1
+        reverse_adj = self._reverse_adjacency
         visited = [False] * n
         stack = [0]
         visited[0] = True
@@ -71,17 +130,13 @@ class AdjacencyListGraph(AbstractGraph):
                     stack.append(v)
         return all(visited)
 
-    def exportToGEPHI(self, path: str) -> None:
-        if not path:
-            raise ValueError("Caminho inválido")
-        nodes_path = f"{path}_nodes.csv"
-        edges_path = f"{path}_edges.csv"
-        with open(nodes_path, "w", encoding="utf-8") as f_nodes:
-            f_nodes.write("id;label;weight\n")
-            for i in range(self._num_vertices):
-                f_nodes.write(f"{i};{i};{self._vertex_weights[i]}\n")
-        with open(edges_path, "w", encoding="utf-8") as f_edges:
-            f_edges.write("source;target;weight\n")
-            for u in range(self._num_vertices):
-                for v, w in self._adjacency[u].items():
-                    f_edges.write(f"{u};{v};{w}\n")
+    def freeze(self) -> CSRGraph:
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for row in self._adjacency:
+            for v in sorted(row):
+                targets.append(v)
+                weights.append(row[v])
+            offsets.append(len(targets))
+        return CSRGraph(self._num_vertices, offsets, targets, weights, self._vertex_weights)
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Iterable, Optional, List, Set, Tuple
 from grafh_blibiotecas.abstract_graph import AbstractGraph
 
 
@@ -8,6 +8,28 @@ class AdjacencyMatrixGraph(AbstractGraph):
         self._matrix: List[List[Optional[float]]] = [
             [None for _ in range(numVertices)] for _ in range(numVertices)
         ]
+        self._row_columns: List[Set[int]] = [set() for _ in range(numVertices)]
+        self._column_rows: List[Set[int]] = [set() for _ in range(numVertices)]
+        self._rows_owned: Optional[bytearray] = None
+        self._row_columns_owned: Optional[bytearray] = None
+        self._column_rows_owned: Optional[bytearray] = None
+
+    def _share_storage_with(self, clone: "AdjacencyMatrixGraph") -> None:
+        clone._matrix = list(self._matrix)
+        clone._row_columns = list(self._row_columns)
+        clone._column_rows = list(self._column_rows)
+        for graph in (self, clone):
+            graph._rows_owned = bytearray(self._num_vertices)
+            graph._row_columns_owned = bytearray(self._num_vertices)
+            graph._column_rows_owned = bytearray(self._num_vertices)
+
+    def _occupy(self, u: int, v: int) -> None:
+        self._own_row(self._row_columns, self._row_columns_owned, u).add(v)
+        self._own_row(self._column_rows, self._column_rows_owned, v).add(u)
+
+    def _vacate(self, u: int, v: int) -> None:
+        self._own_row(self._row_columns, self._row_columns_owned, u).discard(v)
+        self._own_row(self._column_rows, self._column_rows_owned, v).discard(u)
 
     def hasEdge(self, u: int, v: int) -> bool:
         self._validate_edge_indices(u, v)
@@ -16,37 +38,68 @@ class AdjacencyMatrixGraph(AbstractGraph):
     def addEdge(self, u: int, v: int) -> None:
         self._validate_edge_indices(u, v)
         if not self.hasEdge(u, v):
-            self._matrix[u][v] = 1.0
+            self._own_row(self._matrix, self._rows_owned, u)[v] = 1.0
+            self._occupy(u, v)
             self._increment_edge_count()
+            self._on_edge_added(u, v)
 
     def removeEdge(self, u: int, v: int) -> None:
         self._validate_edge_indices(u, v)
         if not self.hasEdge(u, v):
             raise ValueError("Aresta inexistente")
-        self._matrix[u][v] = None
+        self._own_row(self._matrix, self._rows_owned, u)[v] = None
+        self._vacate(u, v)
         self._decrement_edge_count()
+        self._on_edge_removed(u, v)
+
+    def _add_edges_unchecked(self, us, vs, weights, combine) -> None:
+        matrix = self._matrix
+        rows_owned = self._rows_owned
+        components = None if self._components_stale else self._components
+        added = 0
+        for u, v, w in zip(us, vs, weights):
+            row = matrix[u] if rows_owned is None else self._own_row(matrix, rows_owned, u)
+            current = row[v]
+            if current is None:
+                row[v] = w
+                self._occupy(u, v)
+                added += 1
+                if components is not None:
+                    components.union(u, v)
+            elif combine == "sum":
+                row[v] = current + w
+            elif combine == "replace" or w > current:
+                row[v] = w
+        self._edge_count += added
+        self._mark_modified()
+
+    def getSuccessors(self, u: int) -> Iterable[int]:
+        self._validate_vertex_index(u)
+        return sorted(self._row_columns[u])
+
+    def getPredecessors(self, u: int) -> Iterable[int]:
+        self._validate_vertex_index(u)
+        return sorted(self._column_rows[u])
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        row = self._matrix[u]
+        return [(v, row[v]) for v in sorted(self._row_columns[u])]
 
     def getVertexInDegree(self, u: int) -> int:
         self._validate_vertex_index(u)
-        count = 0
-        for i in range(self._num_vertices):
-            if self._matrix[i][u] is not None:
-                count += 1
-        return count
+        return len(self._column_rows[u])
 
     def getVertexOutDegree(self, u: int) -> int:
         self._validate_vertex_index(u)
-        count = 0
-        for j in range(self._num_vertices):
-            if self._matrix[u][j] is not None:
-                count += 1
-        return count
+        return len(self._row_columns[u])
 
     def setEdgeWeight(self, u: int, v: int, w: float) -> None:
         self._validate_edge_indices(u, v)
         if not self.hasEdge(u, v):
             raise ValueError("Não é possível definir peso de aresta inexistente")
-        self._matrix[u][v] = float(w)
+        self._own_row(self._matrix, self._rows_owned, u)[v] = float(w)
+        self._mark_modified()
 
     def getEdgeWeight(self, u: int, v: int) -> float:
         self._validate_edge_indices(u, v)
@@ -61,31 +114,15 @@ class AdjacencyMatrixGraph(AbstractGraph):
         n = self._num_vertices
         if n == 0:
             return False
+        if self._components is not None:
+            return self.getComponentCount() == 1
         visited = [False] * n
         stack = [0]
         visited[0] = True
         while stack:
             u = stack.pop()
-            for v in range(n):
-                if self._matrix[u][v] is not None or self._matrix[v][u] is not None:
-                    if not visited[v]:
-                        visited[v] = True
-                        stack.append(v)
+            for v in self._row_columns[u] | self._column_rows[u]:
+                if not visited[v]:
+                    visited[v] = True
+                    stack.append(v)
         return all(visited)
-
-    def exportToGEPHI(self, path: str) -> None:
-        if not path:
-            raise ValueError("Caminho inválido")
-        nodes_path = f"{path}_nodes.csv"
-        edges_path = f"{path}_edges.csv"
-        with open(nodes_path, "w", encoding="utf-8") as f_nodes:
-            f_nodes.write("id;label;weight\n")
-            for i in range(self._num_vertices):
-                f_nodes.write(f"{i};{i};{self._vertex_weights[i]}\n")
-        with open(edges_path, "w", encoding="utf-8") as f_edges:
-            f_edges.write("source;target;weight\n")
-            for u in range(self._num_vertices):
-                for v in range(self._num_vertices):
-                    if self._matrix[u][v] is not None:
-                        w = self._matrix[u][v]
-                        f_edges.write(f"{u};{v};{w}\n")
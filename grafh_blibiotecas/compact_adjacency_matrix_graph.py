@@ -0,0 +1,169 @@
+import mmap
+from array import array
+from typing import Iterable, List, Optional, Tuple
+from grafh_blibiotecas.abstract_graph import AbstractGraph
+
+
+def _iter_bits(words, start: int, count: int) -> List[int]:
+    bits = []
+    for i in range(count):
+        word = words[start + i]
+        base = i << 6
+        while word:
+            low = word & -word
+            bits.append(base + low.bit_length() - 1)
+            word ^= low
+    return bits
+
+
+class CompactAdjacencyMatrixGraph(AbstractGraph):
+    def __init__(self, numVertices: int, weightsPath: Optional[str] = None):
+        super().__init__(numVertices)
+        n = numVertices
+        self._row_words = (n + 63) >> 6
+        self._row_bits = bytearray(8 * n * self._row_words)
+        self._col_bits = bytearray(8 * n * self._row_words)
+        self._row_view = memoryview(self._row_bits).cast("Q")
+        self._col_view = memoryview(self._col_bits).cast("Q")
+        self._weights_file = None
+        self._weights_mmap: Optional[mmap.mmap] = None
+        if weightsPath is not None and n > 0:
+            self._weights_file = open(weightsPath, "w+b")
+            self._weights_file.truncate(8 * n * n)
+            self._weights_mmap = mmap.mmap(self._weights_file.fileno(), 8 * n * n)
+            self._weights = memoryview(self._weights_mmap).cast("d")
+        else:
+            self._weights = array("d", [0.0]) * (n * n)
+
+    def _share_storage_with(self, clone: "CompactAdjacencyMatrixGraph") -> None:
+        clone._row_bits = bytearray(self._row_bits)
+        clone._col_bits = bytearray(self._col_bits)
+        clone._row_view = memoryview(clone._row_bits).cast("Q")
+        clone._col_view = memoryview(clone._col_bits).cast("Q")
+        weights = array("d")
+        weights.frombytes(memoryview(self._weights).cast("B"))
+        clone._weights = weights
+        clone._weights_file = None
+        clone._weights_mmap = None
+
+    def _has_bit(self, u: int, v: int) -> bool:
+        return (self._row_view[u * self._row_words + (v >> 6)] >> (v & 63)) & 1 == 1
+
+    def _row_popcount(self, bits: bytearray, u: int) -> int:
+        start = 8 * u * self._row_words
+        return int.from_bytes(bits[start:start + 8 * self._row_words], "little").bit_count()
+
+    def close(self) -> None:
+        if self._weights_mmap is not None:
+            self._weights.release()
+            self._weights_mmap.close()
+            self._weights_file.close()
+            self._weights_mmap = None
+            self._weights_file = None
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        self._validate_edge_indices(u, v)
+        return self._has_bit(u, v)
+
+    def addEdge(self, u: int, v: int) -> None:
+        self._validate_edge_indices(u, v)
+        if not self._has_bit(u, v):
+            self._row_view[u * self._row_words + (v >> 6)] |= 1 << (v & 63)
+            self._col_view[v * self._row_words + (u >> 6)] |= 1 << (u & 63)
+            self._weights[u * self._num_vertices + v] = 1.0
+            self._increment_edge_count()
+            self._on_edge_added(u, v)
+
+    def removeEdge(self, u: int, v: int) -> None:
+        self._validate_edge_indices(u, v)
+        if not self._has_bit(u, v):
+            raise ValueError("Aresta inexistente")
+        self._row_view[u * self._row_words + (v >> 6)] &= ~(1 << (v & 63)) & 0xFFFFFFFFFFFFFFFF
+        self._col_view[v * self._row_words + (u >> 6)] &= ~(1 << (u & 63)) & 0xFFFFFFFFFFFFFFFF
+        self._weights[u * self._num_vertices + v] = 0.0
+        self._decrement_edge_count()
+        self._on_edge_removed(u, v)
+
+    def _add_edges_unchecked(self, us, vs, weights, combine) -> None:
+        n = self._num_vertices
+        row_words = self._row_words
+        rows, cols, matrix_weights = self._row_view, self._col_view, self._weights
+        components = None if self._components_stale else self._components
+        added = 0
+        for u, v, w in zip(us, vs, weights):
+            word_index = u * row_words + (v >> 6)
+            mask = 1 << (v & 63)
+            cell = u * n + v
+            if not rows[word_index] & mask:
+                rows[word_index] |= mask
+                cols[v * row_words + (u >> 6)] |= 1 << (u & 63)
+                matrix_weights[cell] = w
+                added += 1
+                if components is not None:
+                    components.union(u, v)
+            elif combine == "sum":
+                matrix_weights[cell] += w
+            elif combine == "replace" or w > matrix_weights[cell]:
+                matrix_weights[cell] = w
+        self._edge_count += added
+        self._mark_modified()
+
+    def getSuccessors(self, u: int) -> Iterable[int]:
+        self._validate_vertex_index(u)
+        return _iter_bits(self._row_view, u * self._row_words, self._row_words)
+
+    def getPredecessors(self, u: int) -> Iterable[int]:
+        self._validate_vertex_index(u)
+        return _iter_bits(self._col_view, u * self._row_words, self._row_words)
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        base = u * self._num_vertices
+        return [(v, self._weights[base + v]) for v in _iter_bits(self._row_view, u * self._row_words, self._row_words)]
+
+    def getVertexInDegree(self, u: int) -> int:
+        self._validate_vertex_index(u)
+        return self._row_popcount(self._col_bits, u)
+
+    def getVertexOutDegree(self, u: int) -> int:
+        self._validate_vertex_index(u)
+        return self._row_popcount(self._row_bits, u)
+
+    def setEdgeWeight(self, u: int, v: int, w: float) -> None:
+        self._validate_edge_indices(u, v)
+        if not self._has_bit(u, v):
+            raise ValueError("Não é possível definir peso de aresta inexistente")
+        self._weights[u * self._num_vertices + v] = float(w)
+        self._mark_modified()
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        self._validate_edge_indices(u, v)
+        if not self._has_bit(u, v):
+            raise ValueError("Aresta inexistente")
+        return float(self._weights[u * self._num_vertices + v])
+
+    def isConnected(self) -> bool:
+        n = self._num_vertices
+        if n == 0:
+            return False
+        if self._components is not None:
+            return self.getComponentCount() == 1
+        row_words = self._row_words
+        rows, cols = self._row_view, self._col_view
+        visited = [False] * n
+        stack = [0]
+        visited[0] = True
+        while stack:
+            u = stack.pop()
+            start = u * row_words
+            for i in range(row_words):
+                word = rows[start + i] | cols[start + i]
+                base = i << 6
+                while word:
+                    low = word & -word
+                    v = base + low.bit_length() - 1
+                    word ^= low
+                    if not visited[v]:
+                        visited[v] = True
+                        stack.append(v)
+        return all(visited)
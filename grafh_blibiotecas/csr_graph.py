@@ -0,0 +1,204 @@
+from array import array
+from bisect import bisect_left
+from typing import Hashable, Iterable, Optional, Sequence, Tuple
+from grafh_blibiotecas.abstract_graph import AbstractGraph
+from grafh_blibiotecas.snapshot_format import readSnapshot
+
+
+def _as_buffer(typecode: str, values):
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    if isinstance(values, memoryview) and values.format == typecode:
+        return values
+    return array(typecode, values)
+
+
+class CSRGraph(AbstractGraph):
+    def __init__(
+        self,
+        numVertices: int,
+        offsets: Sequence[int],
+        targets: Sequence[int],
+        weights: Sequence[float],
+        vertexWeights: Optional[Sequence[float]] = None,
+        labels: Optional[Sequence[Hashable]] = None,
+    ):
+        super().__init__(numVertices)
+        self._offsets = _as_buffer("q", offsets)
+        self._targets = _as_buffer("q", targets)
+        self._weights = _as_buffer("d", weights)
+        if len(self._offsets) != numVertices + 1:
+            raise ValueError("Vetor de offsets deve ter numVertices + 1 posições")
+        if len(self._targets) != len(self._weights):
+            raise ValueError("Vetores de destinos e pesos devem ter o mesmo tamanho")
+        if self._offsets[0] != 0 or self._offsets[numVertices] != len(self._targets):
+            raise ValueError("Vetor de offsets inconsistente com o número de arestas")
+        if vertexWeights is not None:
+            if len(vertexWeights) != numVertices:
+                raise ValueError("Pesos de vértices devem ter numVertices posições")
+            self._vertex_weights = [float(w) for w in vertexWeights]
+        if labels is not None and len(labels) != numVertices:
+            raise ValueError("Rótulos devem ter numVertices posições")
+        self._labels = labels
+        self._snapshot_mapping = None
+        self._edge_count = len(self._targets)
+        self._reverse_offsets: Optional[array] = None
+        self._reverse_targets: Optional[array] = None
+
+    @classmethod
+    def fromEdgeArrays(
+        cls,
+        numVertices: int,
+        us: Sequence[int],
+        vs: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+        combine: str = "sum",
+    ) -> "CSRGraph":
+        builder = cls(numVertices, [0] * (numVertices + 1), [], [])
+        values = builder._validate_edge_batch(us, vs, weights, combine)
+        order = sorted(range(len(us)), key=lambda i: (us[i], vs[i]))
+        offsets = array("q", bytes(8 * (numVertices + 1)))
+        targets = array("q")
+        edge_weights = array("d")
+        last_u = last_v = -1
+        for i in order:
+            u, v = us[i], vs[i]
+            w = 1.0 if values is None else values[i]
+            if u == last_u and v == last_v:
+                if combine == "sum":
+                    edge_weights[-1] += w
+                elif combine == "replace" or w > edge_weights[-1]:
+                    edge_weights[-1] = w
+                continue
+            targets.append(v)
+            edge_weights.append(w)
+            offsets[u + 1] += 1
+            last_u, last_v = u, v
+        for u in range(numVertices):
+            offsets[u + 1] += offsets[u]
+        return cls(numVertices, offsets, targets, edge_weights)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "CSRGraph":
+        data = readSnapshot(path, mmap)
+        graph = cls(data.numVertices, data.offsets, data.targets, data.weights, data.vertexWeights, data.labels)
+        graph._snapshot_mapping = data.mapping
+        return graph
+
+    def _share_storage_with(self, clone: "CSRGraph") -> None:
+        pass
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ("_offsets", "_targets", "_weights"):
+            if isinstance(state[name], memoryview):
+                state[name] = array(state[name].format, state[name])
+        if self._labels is not None and not isinstance(self._labels, list):
+            state["_labels"] = list(self._labels)
+        state["_snapshot_mapping"] = None
+        return state
+
+    def _find_edge(self, u: int, v: int) -> int:
+        start = self._offsets[u]
+        end = self._offsets[u + 1]
+        i = bisect_left(self._targets, v, start, end)
+        if i < end and self._targets[i] == v:
+            return i
+        return -1
+
+    def _ensure_reverse(self) -> None:
+        if self._reverse_offsets is not None:
+            return
+        n = self._num_vertices
+        counts = array("q", bytes(8 * (n + 1)))
+        for v in self._targets:
+            counts[v + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        reverse_targets = array("q", bytes(8 * len(self._targets)))
+        cursor = array("q", counts)
+        for u in range(n):
+            for i in range(self._offsets[u], self._offsets[u + 1]):
+                v = self._targets[i]
+                reverse_targets[cursor[v]] = u
+                cursor[v] += 1
+        self._reverse_offsets = counts
+        self._reverse_targets = reverse_targets
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        self._validate_edge_indices(u, v)
+        return self._find_edge(u, v) >= 0
+
+    def addEdge(self, u: int, v: int) -> None:
+        raise TypeError("Grafo CSR é imutável")
+
+    def removeEdge(self, u: int, v: int) -> None:
+        raise TypeError("Grafo CSR é imutável")
+
+    def _add_edges_unchecked(self, us, vs, weights, combine) -> None:
+        raise TypeError("Grafo CSR é imutável")
+
+    def getSuccessors(self, u: int) -> Iterable[int]:
+        self._validate_vertex_index(u)
+        return self._targets[self._offsets[u]:self._offsets[u + 1]]
+
+    def getPredecessors(self, u: int) -> Iterable[int]:
+        self._validate_vertex_index(u)
+        self._ensure_reverse()
+        return self._reverse_targets[self._reverse_offsets[u]:self._reverse_offsets[u + 1]]
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        start, end = self._offsets[u], self._offsets[u + 1]
+        return zip(self._targets[start:end], self._weights[start:end])
+
+    def getVertexInDegree(self, u: int) -> int:
+        self._validate_vertex_index(u)
+        self._ensure_reverse()
+        return self._reverse_offsets[u + 1] - self._reverse_offsets[u]
+
+    def getVertexLabel(self, v: int) -> Optional[Hashable]:
+        self._validate_vertex_index(v)
+        if self._labels is None:
+            return None
+        return self._labels[v]
+
+    def getVertexOutDegree(self, u: int) -> int:
+        self._validate_vertex_index(u)
+        return self._offsets[u + 1] - self._offsets[u]
+
+    def setEdgeWeight(self, u: int, v: int, w: float) -> None:
+        raise TypeError("Grafo CSR é imutável")
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        self._validate_edge_indices(u, v)
+        i = self._find_edge(u, v)
+        if i < 0:
+            raise ValueError("Aresta inexistente")
+        return float(self._weights[i])
+
+    def isConnected(self) -> bool:
+        n = self._num_vertices
+        if n == 0:
+            return False
+        if self._components is not None:
+            return self.getComponentCount() == 1
+        self._ensure_reverse()
+        offsets, targets = self._offsets, self._targets
+        reverse_offsets, reverse_targets = self._reverse_offsets, self._reverse_targets
+        visited = [False] * n
+        stack = [0]
+        visited[0] = True
+        while stack:
+            u = stack.pop()
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if not visited[v]:
+                    visited[v] = True
+                    stack.append(v)
+            for i in range(reverse_offsets[u], reverse_offsets[u + 1]):
+                v = reverse_targets[i]
+                if not visited[v]:
+                    visited[v] = True
+                    stack.append(v)
+        return all(visited)
@@ -0,0 +1,55 @@
+from typing import List
+
+
+class DisjointSet:
+    def __init__(self, size: int):
+        self._parent: List[int] = list(range(size))
+        self._rank: List[int] = [0] * size
+        self._size: List[int] = [1] * size
+        self._count = size
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def add(self) -> int:
+        x = len(self._parent)
+        self._parent.append(x)
+        self._rank.append(0)
+        self._size.append(1)
+        self._count += 1
+        return x
+
+    def find(self, x: int) -> int:
+        parent = self._parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        if self._rank[root_a] < self._rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        if self._rank[root_a] == self._rank[root_b]:
+            self._rank[root_a] += 1
+        self._count -= 1
+        return True
+
+    def componentSize(self, x: int) -> int:
+        return self._size[self.find(x)]
+
+    def componentCount(self) -> int:
+        return self._count
+
+    def groups(self) -> List[List[int]]:
+        members = {}
+        for x in range(len(self._parent)):
+            members.setdefault(self.find(x), []).append(x)
+        return list(members.values())
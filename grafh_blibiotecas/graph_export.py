@@ -0,0 +1,192 @@
+import gzip
+from typing import List, Mapping, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+EXPORT_CHUNK_LINES = 65536
+
+
+class _ChunkedWriter:
+    def __init__(self, path: str, compress: bool):
+        if compress:
+            self._file = gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+        else:
+            self._file = open(path, "w", encoding="utf-8", buffering=1 << 20)
+        self._chunk: List[str] = []
+
+    def write(self, line: str) -> None:
+        self._chunk.append(line)
+        if len(self._chunk) >= EXPORT_CHUNK_LINES:
+            self.flush()
+
+    def extend(self, lines: List[str]) -> None:
+        self._chunk.extend(lines)
+        if len(self._chunk) >= EXPORT_CHUNK_LINES:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._chunk:
+            self._file.write("".join(self._chunk))
+            self._chunk = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+        self._file.close()
+
+
+def _resolve_labels(graph, labels: Optional[Sequence]) -> List[str]:
+    n = graph.getVertexCount()
+    if labels is not None:
+        if len(labels) != n:
+            raise ValueError("Rótulos devem ter numVertices posições")
+        return [str(label) for label in labels]
+    resolved = []
+    for i in range(n):
+        label = graph.getVertexLabel(i)
+        resolved.append(str(i) if label is None else str(label))
+    return resolved
+
+
+RESERVED_NODE_ATTRIBUTES = ("id", "label", "weight")
+
+
+def _resolve_node_attributes(graph, nodeAttributes: Optional[Mapping[str, Sequence]]) -> List[Tuple[str, str, Sequence]]:
+    if not nodeAttributes:
+        return []
+    n = graph.getVertexCount()
+    resolved = []
+    for name, values in nodeAttributes.items():
+        if name in RESERVED_NODE_ATTRIBUTES:
+            raise ValueError("Nome de atributo reservado")
+        if len(values) != n:
+            raise ValueError("Atributos de vértice devem ter numVertices posições")
+        if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+            kind = "integer"
+        elif all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+            kind = "double"
+        else:
+            kind = "string"
+        resolved.append((str(name), kind, values))
+    return resolved
+
+
+def _suffix(compress: bool) -> str:
+    return ".gz" if compress else ""
+
+
+def exportCSV(
+    graph,
+    path: str,
+    compress: bool = False,
+    labels: Optional[Sequence] = None,
+    nodeAttributes: Optional[Mapping[str, Sequence]] = None,
+) -> List[str]:
+    n = graph.getVertexCount()
+    names = _resolve_labels(graph, labels)
+    attributes = _resolve_node_attributes(graph, nodeAttributes)
+    nodes_path = f"{path}_nodes.csv{_suffix(compress)}"
+    edges_path = f"{path}_edges.csv{_suffix(compress)}"
+    with _ChunkedWriter(nodes_path, compress) as f_nodes:
+        f_nodes.write("id;label;weight" + "".join(f";{name}" for name, _, _ in attributes) + "\n")
+        for i in range(n):
+            extra = "".join(f";{values[i]}" for _, _, values in attributes)
+            f_nodes.write(f"{i};{names[i]};{graph.getVertexWeight(i)}{extra}\n")
+    with _ChunkedWriter(edges_path, compress) as f_edges:
+        f_edges.write("source;target;weight\n")
+        for u in range(n):
+            f_edges.extend([f"{u};{v};{w}\n" for v, w in graph.getWeightedSuccessors(u)])
+    return [nodes_path, edges_path]
+
+
+def exportGEXF(
+    graph,
+    path: str,
+    compress: bool = False,
+    labels: Optional[Sequence] = None,
+    nodeAttributes: Optional[Mapping[str, Sequence]] = None,
+) -> List[str]:
+    n = graph.getVertexCount()
+    names = _resolve_labels(graph, labels)
+    attributes = _resolve_node_attributes(graph, nodeAttributes)
+    gexf_path = f"{path}.gexf{_suffix(compress)}"
+    with _ChunkedWriter(gexf_path, compress) as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<gexf xmlns="http://gexf.net/1.3" version="1.3">\n')
+        f.write('  <graph defaultedgetype="directed">\n')
+        f.write('    <attributes class="node">\n')
+        f.write('      <attribute id="weight" title="weight" type="double"/>\n')
+        for name, kind, _ in attributes:
+            f.write(f'      <attribute id={quoteattr(name)} title={quoteattr(name)} type="{kind}"/>\n')
+        f.write('    </attributes>\n')
+        f.write('    <nodes>\n')
+        for i in range(n):
+            extra = "".join(
+                f'<attvalue for={quoteattr(name)} value={quoteattr(str(values[i]))}/>' for name, _, values in attributes
+            )
+            f.write(
+                f'      <node id="{i}" label={quoteattr(names[i])}>'
+                f'<attvalues><attvalue for="weight" value="{graph.getVertexWeight(i)}"/>{extra}</attvalues></node>\n'
+            )
+        f.write('    </nodes>\n')
+        f.write('    <edges>\n')
+        edge_id = 0
+        for u in range(n):
+            lines = []
+            for v, w in graph.getWeightedSuccessors(u):
+                lines.append(f'      <edge id="{edge_id}" source="{u}" target="{v}" weight="{w}"/>\n')
+                edge_id += 1
+            f.extend(lines)
+        f.write('    </edges>\n')
+        f.write('  </graph>\n')
+        f.write('</gexf>\n')
+    return [gexf_path]
+
+
+def exportGraphML(
+    graph,
+    path: str,
+    compress: bool = False,
+    labels: Optional[Sequence] = None,
+    nodeAttributes: Optional[Mapping[str, Sequence]] = None,
+) -> List[str]:
+    n = graph.getVertexCount()
+    names = _resolve_labels(graph, labels)
+    attributes = _resolve_node_attributes(graph, nodeAttributes)
+    graphml_path = f"{path}.graphml{_suffix(compress)}"
+    with _ChunkedWriter(graphml_path, compress) as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+        f.write('  <key id="label" for="node" attr.name="label" attr.type="string"/>\n')
+        f.write('  <key id="vweight" for="node" attr.name="weight" attr.type="double"/>\n')
+        f.write('  <key id="weight" for="edge" attr.name="weight" attr.type="double"/>\n')
+        for name, kind, _ in attributes:
+            graphml_kind = "int" if kind == "integer" else kind
+            f.write(
+                f'  <key id={quoteattr("node_" + name)} for="node" attr.name={quoteattr(name)} attr.type="{graphml_kind}"/>\n'
+            )
+        f.write('  <graph id="G" edgedefault="directed">\n')
+        for i in range(n):
+            extra = "".join(
+                f'<data key={quoteattr("node_" + name)}>{escape(str(values[i]))}</data>' for name, _, values in attributes
+            )
+            f.write(
+                f'    <node id="n{i}"><data key="label">{escape(names[i])}</data>'
+                f'<data key="vweight">{graph.getVertexWeight(i)}</data>{extra}</node>\n'
+            )
+        for u in range(n):
+            f.extend([
+                f'    <edge source="n{u}" target="n{v}"><data key="weight">{w}</data></edge>\n'
+                for v, w in graph.getWeightedSuccessors(u)
+            ])
+        f.write('  </graph>\n')
+        f.write('</graphml>\n')
+    return [graphml_path]
+
+
+EXPORTERS = {
+    "csv": exportCSV,
+    "gexf": exportGEXF,
+    "graphml": exportGraphML,
+}
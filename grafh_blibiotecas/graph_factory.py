@@ -0,0 +1,52 @@
+from typing import Optional
+from grafh_blibiotecas.abstract_graph import AbstractGraph
+from grafh_blibiotecas.adjacency_list_graph import AdjacencyListGraph
+from grafh_blibiotecas.adjacency_matrix_graph import AdjacencyMatrixGraph
+from grafh_blibiotecas.compact_adjacency_matrix_graph import CompactAdjacencyMatrixGraph
+
+DENSE_GRAPH_THRESHOLD = 0.1
+MATRIX_MAX_VERTICES = 2000
+COMPACT_MATRIX_MAX_VERTICES = 20000
+
+
+def expectedDensity(numVertices: int, expectedEdges: int) -> float:
+    if numVertices < 2:
+        return 0.0
+    return expectedEdges / (numVertices * (numVertices - 1))
+
+
+def chooseRepresentation(numVertices: int, expectedEdges: Optional[int] = None, density: Optional[float] = None) -> type:
+    if density is None:
+        density = 0.0 if expectedEdges is None else expectedDensity(numVertices, expectedEdges)
+    if density < 0:
+        raise ValueError("Densidade não pode ser negativa")
+    if density >= DENSE_GRAPH_THRESHOLD:
+        if numVertices <= MATRIX_MAX_VERTICES:
+            return AdjacencyMatrixGraph
+        if numVertices <= COMPACT_MATRIX_MAX_VERTICES:
+            return CompactAdjacencyMatrixGraph
+    return AdjacencyListGraph
+
+
+def createGraph(numVertices: int, expectedEdges: Optional[int] = None, density: Optional[float] = None) -> AbstractGraph:
+    return chooseRepresentation(numVertices, expectedEdges, density)(numVertices)
+
+
+def _copy_graph(source: AbstractGraph, target: AbstractGraph) -> AbstractGraph:
+    us, vs, ws = source.getEdgeArrays()
+    target._add_edges_unchecked(us, vs, ws, "replace")
+    for i in range(source.getVertexCount()):
+        weight = source.getVertexWeight(i)
+        if weight != 0.0:
+            target.setVertexWeight(i, weight)
+    return target
+
+
+def toList(graph: AbstractGraph) -> AdjacencyListGraph:
+    return _copy_graph(graph, AdjacencyListGraph(graph.getVertexCount()))
+
+
+def toMatrix(graph: AbstractGraph, compact: bool = False) -> AbstractGraph:
+    n = graph.getVertexCount()
+    target = CompactAdjacencyMatrixGraph(n) if compact else AdjacencyMatrixGraph(n)
+    return _copy_graph(graph, target)
@@ -0,0 +1,221 @@
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from grafh_blibiotecas.abstract_graph import AbstractGraph
+
+
+class GraphView(AbstractGraph):
+    def __init__(self, parent: AbstractGraph, numVertices: int):
+        super().__init__(0)
+        self._parent = parent
+        self._num_vertices = numVertices
+
+    def _to_parent(self, v: int) -> int:
+        return v
+
+    def getVersion(self) -> int:
+        return self._parent.getVersion()
+
+    def _share_storage_with(self, clone: "GraphView") -> None:
+        clone._parent = self._parent.snapshot()
+
+    def _read_only(self):
+        raise TypeError("Visão de grafo é somente leitura")
+
+    def addEdge(self, u: int, v: int) -> None:
+        self._read_only()
+
+    def removeEdge(self, u: int, v: int) -> None:
+        self._read_only()
+
+    def setEdgeWeight(self, u: int, v: int, w: float) -> None:
+        self._read_only()
+
+    def _add_edges_unchecked(self, us, vs, weights, combine) -> None:
+        self._read_only()
+
+    def enableConnectivityTracking(self) -> None:
+        raise TypeError("Visões não suportam rastreamento de conectividade")
+
+    def setVertexWeight(self, v: int, w: float) -> None:
+        self._read_only()
+
+    def getVertexWeight(self, v: int) -> float:
+        self._validate_vertex_index(v)
+        return self._parent.getVertexWeight(self._to_parent(v))
+
+    def getVertexLabel(self, v: int) -> Optional[Hashable]:
+        self._validate_vertex_index(v)
+        return self._parent.getVertexLabel(self._to_parent(v))
+
+    def getSuccessors(self, u: int) -> Iterable[int]:
+        return [v for v, _ in self.getWeightedSuccessors(u)]
+
+    def getPredecessors(self, u: int) -> Iterable[int]:
+        return [v for v, _ in self.getWeightedPredecessors(u)]
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        self._validate_edge_indices(u, v)
+        return any(x == v for x in self.getSuccessors(u))
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        self._validate_edge_indices(u, v)
+        for x, w in self.getWeightedSuccessors(u):
+            if x == v:
+                return float(w)
+        raise ValueError("Aresta inexistente")
+
+    def getVertexInDegree(self, u: int) -> int:
+        return len(self.getPredecessors(u))
+
+    def getVertexOutDegree(self, u: int) -> int:
+        return len(self.getSuccessors(u))
+
+    def getEdgeCount(self) -> int:
+        return sum(self.getVertexOutDegree(u) for u in range(self._num_vertices))
+
+    def isConnected(self) -> bool:
+        if self._num_vertices == 0:
+            return False
+        return self.getComponentCount() == 1
+
+
+class SubgraphView(GraphView):
+    def __init__(self, parent: AbstractGraph, vertices: Iterable[int]):
+        parent_vertices = sorted(set(vertices))
+        for v in parent_vertices:
+            parent._validate_vertex_index(v)
+        super().__init__(parent, len(parent_vertices))
+        self._parent_vertices: List[int] = parent_vertices
+        self._local_index: Dict[int, int] = {v: i for i, v in enumerate(parent_vertices)}
+
+    def _to_parent(self, v: int) -> int:
+        return self._parent_vertices[v]
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        local_index = self._local_index
+        return [
+            (local_index[v], w)
+            for v, w in self._parent.getWeightedSuccessors(self._parent_vertices[u])
+            if v in local_index
+        ]
+
+    def getWeightedPredecessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        local_index = self._local_index
+        return [
+            (local_index[v], w)
+            for v, w in self._parent.getWeightedPredecessors(self._parent_vertices[u])
+            if v in local_index
+        ]
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        self._validate_edge_indices(u, v)
+        return self._parent.hasEdge(self._parent_vertices[u], self._parent_vertices[v])
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        self._validate_edge_indices(u, v)
+        return self._parent.getEdgeWeight(self._parent_vertices[u], self._parent_vertices[v])
+
+    def getVertexLabel(self, v: int) -> Optional[Hashable]:
+        label = super().getVertexLabel(v)
+        return self._parent_vertices[v] if label is None else label
+
+    def getParentVertex(self, v: int) -> int:
+        self._validate_vertex_index(v)
+        return self._parent_vertices[v]
+
+
+class EdgeWeightFilterView(GraphView):
+    def __init__(self, parent: AbstractGraph, minWeight: float):
+        super().__init__(parent, parent.getVertexCount())
+        self._min_weight = float(minWeight)
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        min_weight = self._min_weight
+        return [(v, w) for v, w in self._parent.getWeightedSuccessors(u) if w >= min_weight]
+
+    def getWeightedPredecessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        min_weight = self._min_weight
+        return [(v, w) for v, w in self._parent.getWeightedPredecessors(u) if w >= min_weight]
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        self._validate_edge_indices(u, v)
+        return self._parent.hasEdge(u, v) and self._parent.getEdgeWeight(u, v) >= self._min_weight
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        if not self.hasEdge(u, v):
+            raise ValueError("Aresta inexistente")
+        return self._parent.getEdgeWeight(u, v)
+
+
+class ReversedGraphView(GraphView):
+    def __init__(self, parent: AbstractGraph):
+        super().__init__(parent, parent.getVertexCount())
+
+    def getSuccessors(self, u: int) -> Iterable[int]:
+        return self._parent.getPredecessors(u)
+
+    def getPredecessors(self, u: int) -> Iterable[int]:
+        return self._parent.getSuccessors(u)
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        return self._parent.getWeightedPredecessors(u)
+
+    def getWeightedPredecessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        return self._parent.getWeightedSuccessors(u)
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        return self._parent.hasEdge(v, u)
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        return self._parent.getEdgeWeight(v, u)
+
+    def getVertexInDegree(self, u: int) -> int:
+        return self._parent.getVertexOutDegree(u)
+
+    def getVertexOutDegree(self, u: int) -> int:
+        return self._parent.getVertexInDegree(u)
+
+    def getEdgeCount(self) -> int:
+        return self._parent.getEdgeCount()
+
+    def isConnected(self) -> bool:
+        return self._parent.isConnected()
+
+
+class UndirectedGraphView(GraphView):
+    def __init__(self, parent: AbstractGraph):
+        super().__init__(parent, parent.getVertexCount())
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        combined: Dict[int, float] = {}
+        for v, w in self._parent.getWeightedSuccessors(u):
+            combined[v] = combined.get(v, 0.0) + w
+        for v, w in self._parent.getWeightedPredecessors(u):
+            combined[v] = combined.get(v, 0.0) + w
+        return list(combined.items())
+
+    def getWeightedPredecessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        return self.getWeightedSuccessors(u)
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        return self._parent.hasEdge(u, v) or self._parent.hasEdge(v, u)
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        weight = 0.0
+        found = False
+        if self._parent.hasEdge(u, v):
+            weight += self._parent.getEdgeWeight(u, v)
+            found = True
+        if self._parent.hasEdge(v, u):
+            weight += self._parent.getEdgeWeight(v, u)
+            found = True
+        if not found:
+            raise ValueError("Aresta inexistente")
+        return weight
+
+    def isConnected(self) -> bool:
+        return self._parent.isConnected()
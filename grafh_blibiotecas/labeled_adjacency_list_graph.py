@@ -0,0 +1,84 @@
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence
+from grafh_blibiotecas.adjacency_list_graph import AdjacencyListGraph
+from grafh_blibiotecas.csr_graph import CSRGraph
+
+
+class LabeledAdjacencyListGraph(AdjacencyListGraph):
+    def __init__(self, numVertices: int = 0):
+        super().__init__(numVertices)
+        self._labels: List[Optional[Hashable]] = [None] * numVertices
+        self._index_by_label: Dict[Hashable, int] = {}
+        self._labels_shared = False
+
+    def _share_storage_with(self, clone: "LabeledAdjacencyListGraph") -> None:
+        super()._share_storage_with(clone)
+        self._labels_shared = True
+        clone._labels_shared = True
+
+    @classmethod
+    def fromLabels(cls, labels: Iterable[Hashable]) -> "LabeledAdjacencyListGraph":
+        graph = cls()
+        for label in labels:
+            graph.addVertex(label)
+        return graph
+
+    def addVertex(self, label: Optional[Hashable] = None) -> int:
+        if label is not None and label in self._index_by_label:
+            raise ValueError("Rótulo de vértice já existente")
+        if self._labels_shared:
+            self._labels = list(self._labels)
+            self._index_by_label = dict(self._index_by_label)
+            self._labels_shared = False
+        v = self._num_vertices
+        self._adjacency.append({})
+        self._reverse_adjacency.append(set())
+        if self._adjacency_owned is not None:
+            self._adjacency_owned.append(1)
+            self._reverse_owned.append(1)
+        self._vertex_weights.append(0.0)
+        self._labels.append(label)
+        if label is not None:
+            self._index_by_label[label] = v
+        self._num_vertices += 1
+        if self._components is not None:
+            self._components.add()
+        self._mark_modified()
+        return v
+
+    def internVertex(self, label: Hashable) -> int:
+        v = self._index_by_label.get(label)
+        if v is None:
+            v = self.addVertex(label)
+        return v
+
+    def hasVertexLabel(self, label: Hashable) -> bool:
+        return label in self._index_by_label
+
+    def getVertexIndex(self, label: Hashable) -> int:
+        v = self._index_by_label.get(label)
+        if v is None:
+            raise KeyError("Rótulo de vértice inexistente")
+        return v
+
+    def getVertexLabel(self, v: int) -> Optional[Hashable]:
+        self._validate_vertex_index(v)
+        return self._labels[v]
+
+    def getLabels(self) -> List[Optional[Hashable]]:
+        return list(self._labels)
+
+    def addLabeledEdges(
+        self,
+        sources: Sequence[Hashable],
+        targets: Sequence[Hashable],
+        weights: Optional[Sequence[float]] = None,
+        combine: str = "sum",
+    ) -> None:
+        us = [self.internVertex(label) for label in sources]
+        vs = [self.internVertex(label) for label in targets]
+        self.addEdges(us, vs, weights, combine)
+
+    def freeze(self) -> CSRGraph:
+        graph = super().freeze()
+        graph._labels = list(self._labels)
+        return graph
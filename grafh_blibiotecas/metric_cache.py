@@ -0,0 +1,210 @@
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import weakref
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from grafh_blibiotecas.abstract_graph import AbstractGraph
+
+DEFAULT_CACHE_ENTRIES = 256
+STABLE_PARAMETER_TYPES = (type(None), bool, int, float, str)
+
+
+def graphFingerprint(graph: AbstractGraph) -> str:
+    digest = hashlib.sha256()
+    digest.update(graph.getVertexCount().to_bytes(8, "little"))
+    offsets = array("q", [0])
+    targets = array("q")
+    weights = array("d")
+    for u in range(graph.getVertexCount()):
+        for v, w in sorted(graph.getWeightedSuccessors(u)):
+            targets.append(v)
+            weights.append(w)
+        offsets.append(len(targets))
+    for values in (offsets, targets, weights):
+        digest.update(memoryview(values).cast("B"))
+    digest.update(memoryview(array("d", (graph.getVertexWeight(i) for i in range(graph.getVertexCount())))).cast("B"))
+    return digest.hexdigest()
+
+
+def _stable_key(value: Any) -> Optional[str]:
+    if isinstance(value, STABLE_PARAMETER_TYPES):
+        return repr(value)
+    if isinstance(value, (tuple, list)):
+        keys = [_stable_key(item) for item in value]
+        if None in keys:
+            return None
+        return f"{type(value).__name__}({','.join(keys)})"
+    if callable(value):
+        module = getattr(value, "__module__", None)
+        qualname = getattr(value, "__qualname__", None)
+        if module is None or qualname is None or "<" in qualname:
+            return None
+        return f"{module}.{qualname}"
+    return None
+
+
+def _copy_result(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_result(item) for item in value)
+    if isinstance(value, set):
+        return set(value)
+    if isinstance(value, array):
+        return array(value.typecode, value)
+    if isinstance(value, memoryview):
+        return value.toreadonly()
+    return value
+
+
+class MetricCache:
+    def __init__(self, maxEntries: int = DEFAULT_CACHE_ENTRIES, directory: Optional[str] = None):
+        if maxEntries < 1:
+            raise ValueError("Cache precisa de ao menos uma entrada")
+        self._max_entries = maxEntries
+        self._directory = directory
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._finalizers: Dict[int, weakref.finalize] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def setDirectory(self, directory: Optional[str]) -> None:
+        self._directory = directory
+
+    def _forget(self, graph_id: int) -> None:
+        for key in [key for key in self._entries if key[0] == graph_id]:
+            del self._entries[key]
+        self._versions.pop(graph_id, None)
+        self._finalizers.pop(graph_id, None)
+
+    def _watch(self, graph: AbstractGraph) -> int:
+        graph_id = id(graph)
+        if graph_id not in self._finalizers:
+            self._finalizers[graph_id] = weakref.finalize(graph, self._forget, graph_id)
+        version = graph.getVersion()
+        if self._versions.get(graph_id, version) != version:
+            for key in [key for key in self._entries if key[0] == graph_id]:
+                del self._entries[key]
+        self._versions[graph_id] = version
+        return graph_id
+
+    def invalidate(self, graph: Optional[AbstractGraph] = None) -> None:
+        if graph is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == id(graph)]:
+            del self._entries[key]
+
+    def _disk_path(self, graph: AbstractGraph, name: str, params: Tuple) -> Optional[str]:
+        stable_params = _stable_key(params)
+        if stable_params is None:
+            return None
+        fingerprint = self.getOrCompute(graph, "graph_fingerprint", (), lambda: graphFingerprint(graph))
+        key = hashlib.sha256(f"{fingerprint}|{name}|{stable_params}".encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, f"{name}-{key[:32]}.pkl")
+
+    def _load(self, path: str):
+        try:
+            with open(path, "rb") as f:
+                return True, pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+
+    def _store(self, path: str, value: Any) -> None:
+        os.makedirs(self._directory, exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    def lookup(self, graph: AbstractGraph, name: str, params: Tuple, persistent: bool = False) -> Tuple[bool, Any]:
+        key = (self._watch(graph), graph.getVersion(), name, params)
+        try:
+            value = self._entries[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return False, None
+        else:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, _copy_result(value)
+
+        if persistent and self._directory is not None:
+            path = self._disk_path(graph, name, params)
+            if path is not None:
+                found, value = self._load(path)
+                if found:
+                    self.hits += 1
+                    self._remember(key, value)
+                    return True, _copy_result(value)
+        return False, None
+
+    def insert(self, graph: AbstractGraph, name: str, params: Tuple, value: Any, persistent: bool = False) -> None:
+        key = (self._watch(graph), graph.getVersion(), name, params)
+        try:
+            hash(key)
+        except TypeError:
+            return
+        self._remember(key, value)
+        if persistent and self._directory is not None:
+            path = self._disk_path(graph, name, params)
+            if path is not None:
+                self._store(path, value)
+
+    def getOrCompute(
+        self,
+        graph: AbstractGraph,
+        name: str,
+        params: Tuple,
+        compute: Callable[[], Any],
+        persistent: bool = False,
+    ) -> Any:
+        found, value = self.lookup(graph, name, params, persistent)
+        if found:
+            return value
+        self.misses += 1
+        value = compute()
+        self.insert(graph, name, params, value, persistent)
+        return _copy_result(value)
+
+    def _remember(self, key: Tuple, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def memoize(self, name: Optional[str] = None, persistent: bool = False, ignore: Iterable[str] = ()):
+        ignored = set(ignore)
+
+        def decorator(function):
+            signature = inspect.signature(function)
+            metric_name = name or function.__name__
+
+            def cache_key(graph, *args, **kwargs) -> Tuple[str, Tuple]:
+                bound = signature.bind(graph, *args, **kwargs)
+                bound.apply_defaults()
+                params = tuple(
+                    (parameter, value)
+                    for parameter, value in list(bound.arguments.items())[1:]
+                    if parameter not in ignored
+                )
+                return metric_name, params
+
+            @functools.wraps(function)
+            def wrapper(graph, *args, **kwargs):
+                _, params = cache_key(graph, *args, **kwargs)
+                return self.getOrCompute(graph, metric_name, params, lambda: function(graph, *args, **kwargs), persistent)
+
+            wrapper.cacheKey = cache_key
+            wrapper.persistent = persistent
+            return wrapper
+
+        return decorator
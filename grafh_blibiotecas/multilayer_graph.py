@@ -0,0 +1,247 @@
+from array import array
+from itertools import repeat
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
+from grafh_blibiotecas.abstract_graph import AbstractGraph
+from grafh_blibiotecas.graph_views import GraphView
+
+
+class MultiLayerGraph(AbstractGraph):
+    def __init__(self, numVertices: int, layers: Sequence[str]):
+        super().__init__(numVertices)
+        if not layers:
+            raise ValueError("Grafo multicamada precisa de ao menos uma camada")
+        if len(set(layers)) != len(layers):
+            raise ValueError("Camadas duplicadas")
+        self._layers: List[str] = list(layers)
+        self._columns: Dict[str, array] = {layer: array("d") for layer in self._layers}
+        self._adjacency: List[Dict[int, int]] = [{} for _ in range(numVertices)]
+        self._reverse_adjacency: List[Set[int]] = [set() for _ in range(numVertices)]
+        self._free_edge_ids: List[int] = []
+        self._adjacency_owned: Optional[bytearray] = None
+        self._reverse_owned: Optional[bytearray] = None
+        self._columns_owned: Optional[Set[str]] = None
+
+    def _share_storage_with(self, clone: "MultiLayerGraph") -> None:
+        clone._columns = dict(self._columns)
+        clone._adjacency = list(self._adjacency)
+        clone._reverse_adjacency = list(self._reverse_adjacency)
+        clone._free_edge_ids = list(self._free_edge_ids)
+        self._adjacency_owned = bytearray(self._num_vertices)
+        self._reverse_owned = bytearray(self._num_vertices)
+        clone._adjacency_owned = bytearray(self._num_vertices)
+        clone._reverse_owned = bytearray(self._num_vertices)
+        self._columns_owned = set()
+        clone._columns_owned = set()
+
+    def _own_column(self, layer: str) -> array:
+        column = self._columns[layer]
+        if self._columns_owned is not None and layer not in self._columns_owned:
+            column = array("d", column)
+            self._columns[layer] = column
+            self._columns_owned.add(layer)
+        return column
+
+    def _validate_layer(self, layer: str) -> array:
+        column = self._columns.get(layer)
+        if column is None:
+            raise ValueError("Camada inexistente")
+        return column
+
+    def _new_edge_id(self, u: int, v: int) -> int:
+        if self._free_edge_ids:
+            edge_id = self._free_edge_ids.pop()
+        else:
+            edge_id = len(self._columns[self._layers[0]])
+            for layer in self._layers:
+                self._own_column(layer).append(0.0)
+        self._own_row(self._adjacency, self._adjacency_owned, u)[v] = edge_id
+        self._own_row(self._reverse_adjacency, self._reverse_owned, v).add(u)
+        self._increment_edge_count()
+        self._on_edge_added(u, v)
+        return edge_id
+
+    def _edge_id(self, u: int, v: int) -> int:
+        edge_id = self._adjacency[u].get(v)
+        if edge_id is None:
+            raise ValueError("Aresta inexistente")
+        return edge_id
+
+    @classmethod
+    def fromEdgeArrays(
+        cls,
+        numVertices: int,
+        us: Sequence[int],
+        vs: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+        combine: str = "sum",
+        layers: Union[str, Sequence[str]] = "default",
+    ) -> "MultiLayerGraph":
+        if combine != "sum":
+            raise ValueError("Grafo multicamada só combina pesos por soma")
+        layer_names = [layers] if isinstance(layers, str) else list(dict.fromkeys(layers))
+        graph = cls(numVertices, layer_names)
+        graph.addLayerEdges(us, vs, layers, weights)
+        return graph
+
+    def _add_edges_unchecked(self, us, vs, weights, combine) -> None:
+        raise TypeError("Arestas do grafo multicamada devem ser adicionadas por camada")
+
+    def getLayers(self) -> List[str]:
+        return list(self._layers)
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        self._validate_edge_indices(u, v)
+        return v in self._adjacency[u]
+
+    def addEdge(self, u: int, v: int) -> None:
+        self._validate_edge_indices(u, v)
+        if v not in self._adjacency[u]:
+            self._new_edge_id(u, v)
+
+    def removeEdge(self, u: int, v: int) -> None:
+        self._validate_edge_indices(u, v)
+        edge_id = self._edge_id(u, v)
+        for layer in self._layers:
+            self._own_column(layer)[edge_id] = 0.0
+        del self._own_row(self._adjacency, self._adjacency_owned, u)[v]
+        self._own_row(self._reverse_adjacency, self._reverse_owned, v).discard(u)
+        self._free_edge_ids.append(edge_id)
+        self._decrement_edge_count()
+        self._on_edge_removed(u, v)
+
+    def addLayerEdges(
+        self,
+        us: Sequence[int],
+        vs: Sequence[int],
+        layers: Union[str, Sequence[str]],
+        weights: Optional[Sequence[float]] = None,
+    ) -> None:
+        values = self._validate_edge_batch(us, vs, weights, "sum")
+        if isinstance(layers, str):
+            self._validate_layer(layers)
+            layer_names = repeat(layers)
+        else:
+            if len(layers) != len(us):
+                raise ValueError("Vetores de arestas devem ter o mesmo tamanho")
+            for layer in set(layers):
+                self._validate_layer(layer)
+            layer_names = layers
+        if values is None:
+            values = repeat(1.0)
+        adjacency = self._adjacency
+        for u, v, layer, w in zip(us, vs, layer_names, values):
+            edge_id = adjacency[u].get(v)
+            if edge_id is None:
+                edge_id = self._new_edge_id(u, v)
+            self._own_column(layer)[edge_id] += w
+        self._mark_modified()
+
+    def setLayerEdgeWeight(self, u: int, v: int, layer: str, w: float) -> None:
+        self._validate_edge_indices(u, v)
+        self._validate_layer(layer)
+        self._own_column(layer)[self._edge_id(u, v)] = float(w)
+        self._mark_modified()
+
+    def getLayerEdgeWeight(self, u: int, v: int, layer: str) -> float:
+        self._validate_edge_indices(u, v)
+        column = self._validate_layer(layer)
+        return column[self._edge_id(u, v)]
+
+    def getSuccessors(self, u: int) -> Iterable[int]:
+        self._validate_vertex_index(u)
+        return self._adjacency[u].keys()
+
+    def getPredecessors(self, u: int) -> Iterable[int]:
+        self._validate_vertex_index(u)
+        return frozenset(self._reverse_adjacency[u])
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        columns = list(self._columns.values())
+        return [(v, sum(column[edge_id] for column in columns)) for v, edge_id in self._adjacency[u].items()]
+
+    def getVertexInDegree(self, u: int) -> int:
+        self._validate_vertex_index(u)
+        return len(self._reverse_adjacency[u])
+
+    def getVertexOutDegree(self, u: int) -> int:
+        self._validate_vertex_index(u)
+        return len(self._adjacency[u])
+
+    def setEdgeWeight(self, u: int, v: int, w: float) -> None:
+        raise TypeError("Pesos do grafo multicamada são definidos por camada")
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        self._validate_edge_indices(u, v)
+        edge_id = self._edge_id(u, v)
+        return sum(column[edge_id] for column in self._columns.values())
+
+    def isConnected(self) -> bool:
+        if self._num_vertices == 0:
+            return False
+        return self.getComponentCount() == 1
+
+    def view(self, coefficients: Mapping[str, float], binary: bool = False) -> "LayerView":
+        for layer in coefficients:
+            self._validate_layer(layer)
+        return LayerView(self, coefficients, binary)
+
+    def layerView(self, layer: str, binary: bool = False) -> "LayerView":
+        return self.view({layer: 1.0}, binary)
+
+
+class LayerView(GraphView):
+    def __init__(self, parent: MultiLayerGraph, coefficients: Mapping[str, float], binary: bool = False):
+        super().__init__(parent, parent.getVertexCount())
+        self._coefficients = {layer: float(c) for layer, c in coefficients.items()}
+        self._binary = binary
+
+    def _terms(self) -> List[Tuple[array, float]]:
+        columns = self._parent._columns
+        return [(columns[layer], c) for layer, c in self._coefficients.items()]
+
+    def _weight(self, edge_id: int, terms: List[Tuple[array, float]]) -> Optional[float]:
+        present = False
+        weight = 0.0
+        for column, c in terms:
+            value = column[edge_id]
+            if value != 0.0:
+                present = True
+                weight += c * value
+        if not present:
+            return None
+        return 1.0 if self._binary else weight
+
+    def getWeightedSuccessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        terms = self._terms()
+        weighted = []
+        for v, edge_id in self._parent._adjacency[u].items():
+            w = self._weight(edge_id, terms)
+            if w is not None:
+                weighted.append((v, w))
+        return weighted
+
+    def getWeightedPredecessors(self, u: int) -> Iterable[Tuple[int, float]]:
+        self._validate_vertex_index(u)
+        adjacency = self._parent._adjacency
+        terms = self._terms()
+        weighted = []
+        for v in self._parent._reverse_adjacency[u]:
+            w = self._weight(adjacency[v][u], terms)
+            if w is not None:
+                weighted.append((v, w))
+        return weighted
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        self._validate_edge_indices(u, v)
+        edge_id = self._parent._adjacency[u].get(v)
+        return edge_id is not None and self._weight(edge_id, self._terms()) is not None
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        self._validate_edge_indices(u, v)
+        edge_id = self._parent._adjacency[u].get(v)
+        w = None if edge_id is None else self._weight(edge_id, self._terms())
+        if w is None:
+            raise ValueError("Aresta inexistente")
+        return w
@@ -0,0 +1,118 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import BinaryIO, List, Optional, Sequence
+
+SNAPSHOT_MAGIC = b"GRAFCSR\0"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<8sIIQQQ")
+SNAPSHOT_HEADER_SIZE = 64
+FLAG_HAS_LABELS = 1
+
+
+class SnapshotLabels(Sequence[str]):
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if i < 0 or i >= len(self):
+            raise IndexError("Índice de rótulo fora dos limites")
+        return bytes(self._blob[self._offsets[i]:self._offsets[i + 1]]).decode("utf-8")
+
+
+class SnapshotData:
+    def __init__(self, numVertices, offsets, targets, weights, vertexWeights, labels, mapping=None):
+        self.numVertices = numVertices
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.vertexWeights = vertexWeights
+        self.labels = labels
+        self.mapping = mapping
+
+
+def _write_array(f: BinaryIO, values: array) -> None:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(f)
+
+
+def writeSnapshot(
+    path: str,
+    numVertices: int,
+    offsets: array,
+    targets: array,
+    weights: array,
+    vertexWeights: array,
+    labels: Optional[List[str]] = None,
+) -> None:
+    label_offsets = array("q", [0])
+    blob = bytearray()
+    if labels is not None:
+        for label in labels:
+            blob += str(label).encode("utf-8")
+            label_offsets.append(len(blob))
+    flags = FLAG_HAS_LABELS if labels is not None else 0
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, numVertices, len(targets), len(blob))
+    with open(path, "wb") as f:
+        f.write(header.ljust(SNAPSHOT_HEADER_SIZE, b"\0"))
+        _write_array(f, offsets)
+        _write_array(f, targets)
+        _write_array(f, weights)
+        _write_array(f, vertexWeights)
+        if labels is not None:
+            _write_array(f, label_offsets)
+            f.write(blob)
+
+
+def _section(buffer, start: int, count: int, typecode: str, use_mmap: bool):
+    end = start + 8 * count
+    if use_mmap and sys.byteorder == "little":
+        return buffer[start:end].cast(typecode), end
+    values = array(typecode)
+    values.frombytes(buffer[start:end])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values, end
+
+
+def readSnapshot(path: str, use_mmap: bool = True) -> SnapshotData:
+    mapping = None
+    with open(path, "rb") as f:
+        if use_mmap:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            buffer = memoryview(mapping)
+        else:
+            buffer = memoryview(f.read())
+    if len(buffer) < SNAPSHOT_HEADER_SIZE:
+        raise ValueError("Arquivo de snapshot inválido")
+    magic, version, flags, n, m, label_bytes = SNAPSHOT_HEADER.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Arquivo de snapshot inválido")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("Versão de snapshot não suportada")
+    expected = SNAPSHOT_HEADER_SIZE + 8 * (n + 1) + 16 * m + 8 * n
+    if flags & FLAG_HAS_LABELS:
+        expected += 8 * (n + 1) + label_bytes
+    if len(buffer) != expected:
+        raise ValueError("Arquivo de snapshot truncado ou corrompido")
+    position = SNAPSHOT_HEADER_SIZE
+    offsets, position = _section(buffer, position, n + 1, "q", use_mmap)
+    targets, position = _section(buffer, position, m, "q", use_mmap)
+    weights, position = _section(buffer, position, m, "d", use_mmap)
+    vertex_weights, position = _section(buffer, position, n, "d", use_mmap)
+    labels = None
+    if flags & FLAG_HAS_LABELS:
+        label_offsets, position = _section(buffer, position, n + 1, "q", use_mmap)
+        labels = SnapshotLabels(label_offsets, buffer[position:position + label_bytes])
+    return SnapshotData(n, offsets, targets, weights, vertex_weights, labels, mapping)
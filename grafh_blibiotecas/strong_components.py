@@ -0,0 +1,91 @@
+from array import array
+from typing import List, Optional, Tuple
+from grafh_blibiotecas.abstract_graph import AbstractGraph
+from grafh_blibiotecas.adjacency_list_graph import AdjacencyListGraph
+
+
+def stronglyConnectedComponentIds(graph: AbstractGraph) -> Tuple[array, int]:
+    n = graph.getVertexCount()
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    stack: List[int] = []
+    component = array("q", [-1]) * n
+    counter = 0
+    count = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        calls = [(root, iter(graph.getSuccessors(root)))]
+
+        while calls:
+            v, successors = calls[-1]
+            for w in successors:
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    calls.append((w, iter(graph.getSuccessors(w))))
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                calls.pop()
+                if calls:
+                    u = calls[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component[w] = count
+                        if w == v:
+                            break
+                    count += 1
+
+    for v in range(n):
+        component[v] = count - 1 - component[v]
+    return component, count
+
+
+def stronglyConnectedComponents(graph: AbstractGraph) -> List[List[int]]:
+    component, count = stronglyConnectedComponentIds(graph)
+    groups: List[List[int]] = [[] for _ in range(count)]
+    for v, c in enumerate(component):
+        groups[c].append(v)
+    return groups
+
+
+def isStronglyConnected(graph: AbstractGraph) -> bool:
+    if graph.getVertexCount() == 0:
+        return False
+    return stronglyConnectedComponentIds(graph)[1] == 1
+
+
+def condensation(graph: AbstractGraph, componentIds: Optional[Tuple[array, int]] = None) -> Tuple[AdjacencyListGraph, array]:
+    component, count = stronglyConnectedComponentIds(graph) if componentIds is None else componentIds
+    dag = AdjacencyListGraph(count)
+    sizes = [0] * count
+    us = array("q")
+    vs = array("q")
+    ws = array("d")
+    for u in range(graph.getVertexCount()):
+        cu = component[u]
+        sizes[cu] += 1
+        for v, w in graph.getWeightedSuccessors(u):
+            cv = component[v]
+            if cu != cv:
+                us.append(cu)
+                vs.append(cv)
+                ws.append(w)
+    dag._add_edges_unchecked(us, vs, ws, "sum")
+    for c, size in enumerate(sizes):
+        dag.setVertexWeight(c, float(size))
+    return dag, component
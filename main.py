@@ -1,7 +1,9 @@
 import os
 import json
 from extracao.github_extractor import GithubExtractor
-from grafh_blibiotecas.adjacency_list_graph import AdjacencyListGraph
+from grafh_blibiotecas.labeled_adjacency_list_graph import LabeledAdjacencyListGraph
+from grafh_blibiotecas.multilayer_graph import MultiLayerGraph
+from grafh_blibiotecas.graph_factory import chooseRepresentation
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,7 +12,9 @@ DATA_DIR = os.path.join(os.getcwd(), 'data')
 ISSUES_FILE = "issues.json"
 PRS_FILE = "pull_requests.json"
 INTERACTIONS_FILE = "interactions.json"
+SNAPSHOT_FILE = "graph_integrated.bin"
 EXPORT_DIR = "graphs_export"
+EXPORT_FORMATS = ("csv", "gexf")
 
 INTEGRATED_WEIGHTS = {
     "issue_comment": 2,
@@ -73,44 +77,43 @@ def load_jsons(paths):
     return issues, pull_requests, events
 
 
-def collect_users(issues, pull_requests, events):
-    users = set()
+def collect_users(issues, pull_requests, events, graph=None):
+    if graph is None:
+        graph = LabeledAdjacencyListGraph()
+
+    def intern(user):
+        if user is not None:
+            graph.internVertex(user)
 
     for issue in issues:
-        users.add(issue.get("user"))
-        closed_by = issue.get("closed_by")
-        if closed_by:
-            users.add(closed_by)
+        intern(issue.get("user"))
+        intern(issue.get("closed_by"))
         for c in issue.get("comments", []):
-            users.add(c.get("user"))
+            intern(c.get("user"))
 
     for pr in pull_requests:
-        users.add(pr.get("user"))
-        merged_by = pr.get("merged_by")
-        if merged_by:
-            users.add(merged_by)
+        intern(pr.get("user"))
+        intern(pr.get("merged_by"))
         for c in pr.get("comments", []):
-            users.add(c.get("user"))
+            intern(c.get("user"))
         for r in pr.get("reviews", []):
-            users.add(r.get("user"))
+            intern(r.get("user"))
 
     for e in events:
-        users.add(e.get("source"))
-        users.add(e.get("target"))
-
-    users.discard(None)
-    users_list = sorted(users)
-    index_by_user = {u: i for i, u in enumerate(users_list)}
+        intern(e.get("source"))
+        intern(e.get("target"))
 
-    print(f"Total de usuários distintos: {len(users_list)}")
-    return users_list, index_by_user
+    print(f"Total de usuários distintos: {graph.getVertexCount()}")
+    return graph
 
 
-def build_graph_comments(events, index_by_user, num_vertices):
-    graph = AdjacencyListGraph(num_vertices)
+def collect_edge_arrays(events, index_by_user, weights_by_type):
+    us = []
+    vs = []
+    ws = []
     for e in events:
         t = e.get("type")
-        if t not in ("issue_comment", "pr_comment"):
+        if t not in weights_by_type:
             continue
         source = e.get("source")
         target = e.get("target")
@@ -120,36 +123,40 @@ def build_graph_comments(events, index_by_user, num_vertices):
         v = index_by_user[target]
         if u == v:
             continue
-        if not graph.hasEdge(u, v):
-            graph.addEdge(u, v)
-            graph.setEdgeWeight(u, v, 1.0)
-    return graph
+        us.append(u)
+        vs.append(v)
+        ws.append(float(weights_by_type[t]))
+    return us, vs, ws
+
+
+def build_from_edge_arrays(num_vertices, us, vs, ws, combine):
+    representation = chooseRepresentation(num_vertices, len(set(zip(us, vs))))
+    return representation.fromEdgeArrays(num_vertices, us, vs, ws, combine=combine)
+
+
+def build_graph_comments(events, index_by_user, num_vertices):
+    us, vs, ws = collect_edge_arrays(events, index_by_user, {"issue_comment": 1.0, "pr_comment": 1.0})
+    return build_from_edge_arrays(num_vertices, us, vs, ws, "replace")
 
 
 def build_graph_issue_closures(events, index_by_user, num_vertices):
-    graph = AdjacencyListGraph(num_vertices)
-    for e in events:
-        if e.get("type") != "issue_closed":
-            continue
-        source = e.get("source")
-        target = e.get("target")
-        if source not in index_by_user or target not in index_by_user:
-            continue
-        u = index_by_user[source]
-        v = index_by_user[target]
-        if u == v:
-            continue
-        if not graph.hasEdge(u, v):
-            graph.addEdge(u, v)
-            graph.setEdgeWeight(u, v, 1.0)
-    return graph
+    us, vs, ws = collect_edge_arrays(events, index_by_user, {"issue_closed": 1.0})
+    return build_from_edge_arrays(num_vertices, us, vs, ws, "replace")
 
 
 def build_graph_reviews_merges(events, index_by_user, num_vertices):
-    graph = AdjacencyListGraph(num_vertices)
+    us, vs, ws = collect_edge_arrays(events, index_by_user, {"pr_review": 1.0, "pr_merge": 1.0})
+    return build_from_edge_arrays(num_vertices, us, vs, ws, "replace")
+
+
+def build_multilayer_graph(events, index_by_user, num_vertices):
+    graph = MultiLayerGraph(num_vertices, list(INTEGRATED_WEIGHTS))
+    us = []
+    vs = []
+    layers = []
     for e in events:
         t = e.get("type")
-        if t not in ("pr_review", "pr_merge"):
+        if t not in INTEGRATED_WEIGHTS:
             continue
         source = e.get("source")
         target = e.get("target")
@@ -159,37 +166,35 @@ def build_graph_reviews_merges(events, index_by_user, num_vertices):
         v = index_by_user[target]
         if u == v:
             continue
-        if not graph.hasEdge(u, v):
-            graph.addEdge(u, v)
-            graph.setEdgeWeight(u, v, 1.0)
+        us.append(u)
+        vs.append(v)
+        layers.append(t)
+    graph.addLayerEdges(us, vs, layers)
     return graph
 
 
-def build_integrated_graph(events, index_by_user, num_vertices):
-    graph = AdjacencyListGraph(num_vertices)
+def build_labeled_graph(events, weights_by_type=INTEGRATED_WEIGHTS, combine="sum", graph=None):
+    if graph is None:
+        graph = LabeledAdjacencyListGraph()
+    sources = []
+    targets = []
+    ws = []
     for e in events:
         t = e.get("type")
-        if t not in INTEGRATED_WEIGHTS:
+        if t not in weights_by_type:
             continue
         source = e.get("source")
         target = e.get("target")
-        if source not in index_by_user or target not in index_by_user:
+        if source is None or target is None or source == target:
             continue
-        u = index_by_user[source]
-        v = index_by_user[target]
-        if u == v:
-            continue
-        w = float(INTEGRATED_WEIGHTS[t])
-        if not graph.hasEdge(u, v):
-            graph.addEdge(u, v)
-            graph.setEdgeWeight(u, v, w)
-        else:
-            current = graph.getEdgeWeight(u, v)
-            graph.setEdgeWeight(u, v, current + w)
+        sources.append(source)
+        targets.append(target)
+        ws.append(float(weights_by_type[t]))
+    graph.addLabeledEdges(sources, targets, ws, combine=combine)
     return graph
 
 
-def export_all_graphs(graph1, graph2, graph3, integrated):
+def export_all_graphs(graph1, graph2, graph3, integrated, users=None, formats=EXPORT_FORMATS, compress=False):
     if not os.path.isdir(EXPORT_DIR):
         os.makedirs(EXPORT_DIR, exist_ok=True)
 
@@ -198,17 +203,15 @@ def export_all_graphs(graph1, graph2, graph3, integrated):
     g3_path = os.path.join(EXPORT_DIR, "graph3_reviews_merges")
     gi_path = os.path.join(EXPORT_DIR, "graph_integrated")
 
-    print("Exportando Grafo 1 (comentários)...")
-    graph1.exportToGEPHI(g1_path)
-
-    print("Exportando Grafo 2 (fechamento de issues)...")
-    graph2.exportToGEPHI(g2_path)
-
-    print("Exportando Grafo 3 (reviews/merges de PR)...")
-    graph3.exportToGEPHI(g3_path)
-
-    print("Exportando Grafo Integrado...")
-    integrated.exportToGEPHI(gi_path)
+    for titulo, graph, path in (
+        ("Grafo 1 (comentários)", graph1, g1_path),
+        ("Grafo 2 (fechamento de issues)", graph2, g2_path),
+        ("Grafo 3 (reviews/merges de PR)", graph3, g3_path),
+        ("Grafo Integrado", integrated, gi_path),
+    ):
+        print(f"Exportando {titulo}...")
+        for export_format in formats:
+            graph.export(path, export_format, compress=compress, labels=users)
 
     print("Exportação concluída.")
 
@@ -216,26 +219,26 @@ def export_all_graphs(graph1, graph2, graph3, integrated):
 def main():
     paths = ensure_data_files() #aprovada
     issues, pull_requests, events = load_jsons(paths)
-    users, index_by_user = collect_users(issues, pull_requests, events)
+    users = collect_users(issues, pull_requests, events).getLabels()
+    index_by_user = {u: i for i, u in enumerate(users)}
     num_vertices = len(users)
 
-    print("Construindo Grafo 1: comentários em issues e pull requests.")
-    graph1 = build_graph_comments(events, index_by_user, num_vertices)
-    print(f"Grafo 1: {graph1.getVertexCount()} vértices, {graph1.getEdgeCount()} arestas.")
+    print("Construindo grafo multicamada a partir das interações.")
+    layers = build_multilayer_graph(events, index_by_user, num_vertices)
+
+    graph1 = layers.view({"issue_comment": 1.0, "pr_comment": 1.0}, binary=True)
+    print(f"Grafo 1 (comentários): {graph1.getVertexCount()} vértices, {graph1.getEdgeCount()} arestas.")
 
-    print("Construindo Grafo 2: fechamento de issues por outros usuários.")
-    graph2 = build_graph_issue_closures(events, index_by_user, num_vertices)
-    print(f"Grafo 2: {graph2.getVertexCount()} vértices, {graph2.getEdgeCount()} arestas.")
+    graph2 = layers.view({"issue_closed": 1.0}, binary=True)
+    print(f"Grafo 2 (fechamento de issues): {graph2.getVertexCount()} vértices, {graph2.getEdgeCount()} arestas.")
 
-    print("Construindo Grafo 3: revisões/aprovações/merges de pull requests.")
-    graph3 = build_graph_reviews_merges(events, index_by_user, num_vertices)
-    print(f"Grafo 3: {graph3.getVertexCount()} vértices, {graph3.getEdgeCount()} arestas.")
+    graph3 = layers.view({"pr_review": 1.0, "pr_merge": 1.0}, binary=True)
+    print(f"Grafo 3 (reviews/merges de PR): {graph3.getVertexCount()} vértices, {graph3.getEdgeCount()} arestas.")
 
-    print("Construindo Grafo Integrado ponderado.")
-    integrated = build_integrated_graph(events, index_by_user, num_vertices)
+    integrated = layers.view(INTEGRATED_WEIGHTS)
     print(f"Grafo Integrado: {integrated.getVertexCount()} vértices, {integrated.getEdgeCount()} arestas.")
 
-    export_all_graphs(graph1, graph2, graph3, integrated)
+    export_all_graphs(graph1, graph2, graph3, integrated, users)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+import random
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("github")
+
+from analysis import approximate_betweenness_centrality, betweenness_centrality
+from grafh_blibiotecas.adjacency_list_graph import AdjacencyListGraph
+
+SEED = 20240611
+
+
+def preferential_attachment_graph(numero_vertices=300, arestas_por_vertice=3, seed=SEED):
+    gerador = random.Random(seed)
+    grafo = AdjacencyListGraph(numero_vertices)
+    extremidades = list(range(arestas_por_vertice))
+    for novo in range(arestas_por_vertice, numero_vertices):
+        escolhidos = set()
+        while len(escolhidos) < arestas_por_vertice:
+            escolhidos.add(gerador.choice(extremidades))
+        for vizinho in escolhidos:
+            grafo.addEdge(novo, vizinho)
+            grafo.addEdge(vizinho, novo)
+            extremidades.extend((novo, vizinho))
+    return grafo
+
+
+def top_10(centralidade):
+    return set(sorted(centralidade, key=lambda v: (-centralidade[v], v))[:10])
+
+
+@pytest.mark.parametrize("parametros", [{"samples": 100}, {"epsilon": 0.2}])
+def test_approximation_within_bound_and_keeps_top_10(parametros):
+    grafo = preferential_attachment_graph()
+    exata = betweenness_centrality(grafo)
+
+    aproximada, limite = approximate_betweenness_centrality(grafo, delta=0.1, seed=SEED, **parametros)
+
+    assert 0.0 < limite < 1.0
+    if "epsilon" in parametros:
+        assert limite <= parametros["epsilon"]
+    assert max(abs(aproximada[v] - exata[v]) for v in exata) <= limite
+    assert len(top_10(aproximada) & top_10(exata)) >= 7
+
+
+def test_approximation_is_reproducible_with_seed():
+    grafo = preferential_attachment_graph()
+    primeira = approximate_betweenness_centrality(grafo, samples=50, seed=SEED)
+    segunda = approximate_betweenness_centrality(grafo, samples=50, seed=SEED)
+    assert primeira == segunda
@@ -0,0 +1,51 @@
+import random
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("github")
+
+from analysis import METRIC_CACHE, betweenness_centrality, run_metric_pipeline, weighted_betweenness_centrality
+from grafh_blibiotecas.adjacency_list_graph import AdjacencyListGraph
+
+SEED = 20240611
+
+
+def random_weighted_graph(numero_vertices=300, numero_arestas=2400, seed=SEED):
+    gerador = random.Random(seed)
+    us = []
+    vs = []
+    pesos = []
+    for _ in range(numero_arestas):
+        u = gerador.randrange(numero_vertices)
+        v = gerador.randrange(numero_vertices)
+        if u != v:
+            us.append(u)
+            vs.append(v)
+            pesos.append(float(gerador.randint(1, 5)))
+    grafo = AdjacencyListGraph(numero_vertices)
+    grafo.addEdges(us, vs, pesos, combine="sum")
+    return grafo
+
+
+@pytest.mark.parametrize("centralidade", [betweenness_centrality, weighted_betweenness_centrality])
+def test_parallel_betweenness_matches_serial_bit_for_bit(centralidade):
+    grafo = random_weighted_graph()
+
+    METRIC_CACHE.invalidate(grafo)
+    serial = centralidade(grafo, workers=1)
+    METRIC_CACHE.invalidate(grafo)
+    paralela = centralidade(grafo, workers=3)
+
+    assert paralela == serial
+
+
+def test_pipeline_betweenness_matches_serial_bit_for_bit():
+    grafo = random_weighted_graph()
+    metricas = ["betweenness", "weighted_betweenness"]
+
+    METRIC_CACHE.invalidate(grafo)
+    serial = run_metric_pipeline(grafo, metricas, workers=1)
+    METRIC_CACHE.invalidate(grafo)
+    paralela = run_metric_pipeline(grafo, metricas, workers=3)
+
+    assert paralela == serial